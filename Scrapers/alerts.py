@@ -0,0 +1,257 @@
+import argparse
+import json
+import socket
+import threading
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from bookmakers import MATCH_KEYS, OUTCOMES
+from consensus import book_weights, consensus_probabilities
+from match_index import MATCH_INDEX
+from odds_book import OddsBook, best_prices
+from topk import TopK
+
+
+def print_alert(alert):
+    """Default sink: one readable line per alert."""
+    if alert['type'] == 'arbitrage':
+        legs = ", ".join(
+            f"{outcome} {leg['bookmaker']} @ {leg['odds']:.2f}" for outcome, leg in alert['legs'].items())
+        print(f"ARB {alert['match']}: {alert['profit']:.2f}% ({legs})")
+    elif alert['type'] == 'arbitrage_closed':
+        print(f"ARB CLOSED {alert['match']}")
+    else:
+        print(f"VALUE {alert['match']}: {alert['outcome']} {alert['bookmaker']} @ {alert['odds']:.2f} "
+              f"(EV {alert['expected_value']:+.3f})")
+
+
+class JsonlSink:
+    """Append every alert as one JSON line."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'a', encoding='utf-8')
+        self._lock = threading.Lock()
+
+    def __call__(self, alert):
+        with self._lock:
+            self._file.write(json.dumps(alert) + '\n')
+            self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+
+class SocketSink:
+    """Broadcast alerts as JSON lines to every client connected to a local TCP port."""
+
+    def __init__(self, host='127.0.0.1', port=8765):
+        self._server = socket.create_server((host, port))
+        self.address = self._server.getsockname()
+        self._clients = []
+        self._lock = threading.Lock()
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while True:
+            try:
+                client, _ = self._server.accept()
+            except OSError:
+                return  # Server closed
+            # A stuck client must not hold up the stream
+            client.settimeout(0.5)
+            with self._lock:
+                self._clients.append(client)
+
+    def __call__(self, alert):
+        line = (json.dumps(alert) + '\n').encode('utf-8')
+        with self._lock:
+            for client in list(self._clients):
+                try:
+                    client.sendall(line)
+                except OSError:
+                    self._clients.remove(client)
+                    client.close()
+
+    def close(self):
+        self._server.close()
+        with self._lock:
+            for client in self._clients:
+                client.close()
+            self._clients.clear()
+
+
+class AlertStream:
+    """
+    Turn price updates into arbitrage and value-bet alerts as they arrive.
+
+    Prices are written into an OddsBook, and only the matches whose prices
+    changed are re-checked, so an alert goes out as soon as the scrape that
+    moved a price returns instead of after the next full CSV rescan.
+
+    An arbitrage alert is sent when a match's best prices sum to a book
+    below 1 (again whenever its legs change), and a closing alert when it
+    disappears. A value alert is sent when a price beats the weighted
+    consensus fair probability of that match (see consensus.py) by at least
+    `min_ev`. Each alert is a dict passed to every sink.
+
+    `top_arbitrages` (match ID -> profit %) and `top_values` ((match ID,
+    bookmaker, outcome) -> EV) rank every current opportunity as prices
+    change, so "best N right now" never needs a full sort.
+    """
+
+    def __init__(self, sinks=None, min_ev=0.02, book=None, match_index=MATCH_INDEX, top_k=100):
+        self.sinks = sinks if sinks is not None else [print_alert]
+        self.min_ev = min_ev
+        self.book = book or OddsBook()
+        self.match_index = match_index
+        self._listed = {}
+        self._open_arbs = {}
+        self._open_values = {}
+        self.top_arbitrages = TopK(top_k)
+        self.top_values = TopK(top_k)
+        self._lock = threading.Lock()
+
+    def on_frame(self, bookmaker, df):
+        """Take a bookmaker's freshly scraped per-source DataFrame."""
+        received = time.perf_counter()
+        df = df.dropna(subset=MATCH_KEYS)
+        odds = df[[f'{outcome} Odds' for outcome in OUTCOMES]].to_numpy(dtype=float)
+
+        # Books land on several threads; assign IDs and load prices as one step
+        with self._lock:
+            match_ids = self.match_index.assign(df)
+            changed = self.book.load(bookmaker, match_ids, odds)
+            # Matches the book stopped listing lose its prices
+            listed = set(match_ids.tolist())
+            dropped = np.fromiter(self._listed.get(bookmaker, set()) - listed, dtype=np.int64)
+            changed = np.concatenate([changed, self.book.load(
+                bookmaker, dropped, np.full((len(dropped), len(OUTCOMES)), np.nan))])
+            self._listed[bookmaker] = listed
+            alerts = self._check(changed)
+        self._emit(alerts, received)
+
+    def update(self, match_id, bookmaker, outcome, price):
+        """Take a single decimal price update."""
+        received = time.perf_counter()
+        with self._lock:
+            previous = self.book.update(match_id, bookmaker, outcome, price)
+            stored = float(self.book.odds.dtype.type(price))
+            if previous == stored or (np.isnan(previous) and not price > 1):
+                return
+            self._listed.setdefault(bookmaker, set()).add(match_id)
+            alerts = self._check(np.array([match_id]))
+        self._emit(alerts, received)
+
+    def _check(self, match_ids):
+        """Re-evaluate the given matches and return the alerts they raise."""
+        if not len(match_ids):
+            return []
+        match_ids = np.unique(match_ids)
+        odds = self.book.odds[match_ids].astype(float)
+        fixtures = self.match_index.fixtures(match_ids)
+        labels = (fixtures['Home Team'].astype(str) + ' vs ' + fixtures['Away Team'].astype(str)).tolist()
+        bookmakers = self.book.bookmakers
+        alerts = []
+
+        # Arbitrage on the best price per outcome
+        best_odds, best_books = best_prices(odds)
+        book_sum = (1 / best_odds).sum(axis=1)
+        is_arb = np.isfinite(best_odds).all(axis=1) & (book_sum < 1)
+        profit = (1 / book_sum - 1) * 100
+        for i, match_id in enumerate(match_ids.tolist()):
+            self.top_arbitrages.update(match_id, profit[i] if is_arb[i] else None)
+            if is_arb[i]:
+                legs = {
+                    outcome: {'bookmaker': bookmakers[best_books[i, o]], 'odds': round(float(best_odds[i, o]), 3)}
+                    for o, outcome in enumerate(OUTCOMES)
+                }
+                if self._open_arbs.get(match_id) != legs:
+                    self._open_arbs[match_id] = legs
+                    alerts.append({
+                        'type': 'arbitrage',
+                        'match_id': match_id,
+                        'match': labels[i],
+                        'legs': legs,
+                        'book_sum': round(float(book_sum[i]), 4),
+                        'profit': round(float(profit[i]), 2)
+                    })
+            elif self._open_arbs.pop(match_id, None) is not None:
+                alerts.append({'type': 'arbitrage_closed', 'match_id': match_id, 'match': labels[i]})
+
+        # Value bets against the weighted consensus fair probability
+        consensus = consensus_probabilities(odds, book_weights(bookmakers))
+        expected_value = consensus[:, None, :] * odds - 1
+        self.top_values.update_many(
+            [(match_id, bookmaker, outcome) for match_id in match_ids.tolist()
+             for bookmaker in bookmakers for outcome in OUTCOMES],
+            expected_value.ravel().tolist())
+        values = np.argwhere(expected_value >= self.min_ev)
+        current = set()
+        for i, b, o in values.tolist():
+            key = (int(match_ids[i]), b, o)
+            current.add(key)
+            price = float(odds[i, b, o])
+            if self._open_values.get(key) == price:
+                continue
+            self._open_values[key] = price
+            alerts.append({
+                'type': 'value',
+                'match_id': key[0],
+                'match': labels[i],
+                'bookmaker': bookmakers[b],
+                'outcome': OUTCOMES[o],
+                'odds': round(price, 3),
+                'probability': round(float(consensus[i, o]), 4),
+                'expected_value': round(float(expected_value[i, b, o]), 4)
+            })
+        # Forget value bets on these matches that no longer qualify
+        checked = set(match_ids.tolist())
+        for key in [key for key in self._open_values if key[0] in checked and key not in current]:
+            del self._open_values[key]
+        return alerts
+
+    def _emit(self, alerts, received):
+        if not alerts:
+            return
+        now = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        latency = round((time.perf_counter() - received) * 1000, 2)
+        for alert in alerts:
+            alert['time'] = now
+            alert['latency_ms'] = latency
+            for sink in self.sinks:
+                try:
+                    sink(alert)
+                except Exception as e:
+                    print(f"Alert sink failed: {e}")
+
+
+def main():
+    from daemon import ScrapeDaemon
+
+    parser = argparse.ArgumentParser(description="Scrape continuously and stream arbitrage and value alerts.")
+    parser.add_argument('--jsonl', help="also append alerts to this JSONL file")
+    parser.add_argument('--port', type=int, help="also broadcast alerts on this local TCP port")
+    parser.add_argument('--min-ev', type=float, default=0.02, help="smallest expected value to alert on")
+    parser.add_argument('--interval', type=float, default=300, help="starting scrape interval in seconds")
+    args = parser.parse_args()
+
+    sinks = [print_alert]
+    if args.jsonl:
+        sinks.append(JsonlSink(args.jsonl))
+    if args.port:
+        sinks.append(SocketSink(port=args.port))
+        print(f"Streaming alerts on 127.0.0.1:{args.port}")
+
+    stream = AlertStream(sinks=sinks, min_ev=args.min_ev)
+    ScrapeDaemon(base_interval=args.interval, on_result=stream.on_frame).run()
+
+    for sink in sinks:
+        if hasattr(sink, 'close'):
+            sink.close()
+
+
+if __name__ == "__main__":
+    main()
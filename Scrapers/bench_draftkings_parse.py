@@ -0,0 +1,51 @@
+import argparse
+import glob
+import time
+
+from draftkings_parser import BACKENDS, etree
+
+# Where recorded DraftKings pages are saved
+DEFAULT_FIXTURES = 'fixtures/draftkings/*.html'
+
+
+def benchmark(pages, backend, repeat):
+    """Return the best-of-`repeat` seconds to parse every page, and the events found."""
+    best = float('inf')
+    events = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        events = [BACKENDS[backend](content) for content in pages]
+        best = min(best, time.perf_counter() - start)
+    return best, events
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare DraftKings HTML parsing backends on saved pages.")
+    parser.add_argument('paths', nargs='*', help=f"HTML fixture files (default: {DEFAULT_FIXTURES})")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    paths = args.paths or sorted(glob.glob(DEFAULT_FIXTURES))
+    if not paths:
+        print(f"No fixture pages found in '{DEFAULT_FIXTURES}'. Record some first.")
+        return
+
+    pages = []
+    for path in paths:
+        with open(path, 'rb') as f:
+            pages.append(f.read())
+    size = sum(len(page) for page in pages) / 1e6
+    print(f"{len(pages)} pages, {size:.1f} MB")
+
+    backends = list(BACKENDS) if etree is not None else ['bs4']
+    baseline_seconds, baseline_events = benchmark(pages, 'bs4', args.repeat)
+    for backend in backends:
+        seconds, events = benchmark(pages, backend, args.repeat)
+        n_events = sum(len(page_events) for page_events in events)
+        agrees = "same as bs4" if events == baseline_events else "DIFFERS from bs4"
+        print(f"{backend:>6}: {seconds * 1000:8.1f} ms  {baseline_seconds / seconds:5.1f}x  "
+              f"{n_events} events ({agrees})")
+
+
+if __name__ == "__main__":
+    main()
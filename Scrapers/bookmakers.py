@@ -0,0 +1,160 @@
+import importlib
+
+import pandas as pd
+
+from match_index import MATCH_INDEX
+
+# Outcomes of a 1x2 market, in column order
+OUTCOMES = ['Home Win', 'Draw', 'Away Win']
+
+# Columns identifying a match in every per-source DataFrame
+MATCH_KEYS = ['Home Team', 'Away Team']
+
+# Every bookmaker the pipeline knows about, defined once. 'odds_format' is
+# the format the bookmaker's page prints prices in (scrapers convert to
+# decimal at ingest, so every DataFrame downstream holds decimal odds),
+# 'scraper' is a "module:function" path, so the analysis scripts can read
+# the registry without importing Selenium, 'latency_budget' is how many
+# seconds a scrape may spend fetching and waiting for odds to render, and
+# 'weight' is the book's share of the consensus fair price (the sharp book
+# counts most).
+BOOKMAKERS = {
+    'draftkings': {
+        'odds_format': 'american',
+        'scraper': 'scrapers:scrape_draftkings',
+        'latency_budget': 15,
+        'weight': 1.0
+    },
+    'pinnacle': {
+        'odds_format': 'decimal',
+        'scraper': 'scrapers:scrape_pinnacle',
+        'latency_budget': 20,
+        'weight': 3.0
+    },
+    'betmgm': {
+        'odds_format': 'decimal',
+        'scraper': 'scrapers:scrape_betmgm',
+        'latency_budget': 20,
+        'weight': 1.0
+    }
+}
+
+
+def register_bookmaker(name, odds_format, scraper, latency_budget=30, weight=1.0):
+    """Add (or replace) a bookmaker in the registry."""
+    BOOKMAKERS[name] = {
+        'odds_format': odds_format,
+        'scraper': scraper,
+        'latency_budget': latency_budget,
+        'weight': weight
+    }
+
+
+def load_scraper(name):
+    """Resolve a bookmaker's scraper to a callable."""
+    scraper = BOOKMAKERS[name]['scraper']
+    if callable(scraper):
+        return scraper
+    module_name, function_name = scraper.split(':')
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def load_scrapers(names=None):
+    """Map each bookmaker name to its scraper callable."""
+    return {name: load_scraper(name) for name in (names or BOOKMAKERS)}
+
+
+def odds_column(outcome, bookmaker):
+    return f'{outcome} Odds_{bookmaker}'
+
+
+def probability_column(outcome, bookmaker):
+    return f'{outcome} Probability_{bookmaker}'
+
+
+def odds_columns(bookmakers):
+    return [odds_column(outcome, bookmaker) for bookmaker in bookmakers for outcome in OUTCOMES]
+
+
+def probability_columns(bookmakers):
+    return [probability_column(outcome, bookmaker) for bookmaker in bookmakers for outcome in OUTCOMES]
+
+
+def bookmakers_in(df_combined):
+    """Return the registered bookmakers that have a full set of odds columns."""
+    return [
+        bookmaker for bookmaker in BOOKMAKERS
+        if all(odds_column(outcome, bookmaker) in df_combined.columns for outcome in OUTCOMES)
+    ]
+
+
+def combine_bookmakers(frames, join='outer', match_index=MATCH_INDEX):
+    """
+    Join per-source DataFrames into the wide combined layout.
+
+    `frames` maps a bookmaker name to the DataFrame its scraper returned.
+    Every row is given an integer match ID from `match_index`, all sources
+    are joined in a single n-way concat on that ID, and average odds and
+    probabilities are added over the sources present. With the default
+    outer join a match listed by only some books is kept, with NaN prices
+    for the others; pass join='inner' to keep only matches every book lists.
+    """
+    bookmakers = list(frames)
+    value_columns = [f'{outcome} Odds' for outcome in OUTCOMES] + \
+        [f'{outcome} Probability' for outcome in OUTCOMES]
+
+    indexed = []
+    for bookmaker in bookmakers:
+        # A row without both team names cannot be matched to a fixture
+        df = frames[bookmaker].dropna(subset=MATCH_KEYS)
+        df = df.set_index(pd.Index(match_index.assign(df), name='Match ID'))
+        df = df[~df.index.duplicated()][value_columns].rename(columns={
+            f'{outcome} Odds': odds_column(outcome, bookmaker) for outcome in OUTCOMES
+        } | {
+            f'{outcome} Probability': probability_column(outcome, bookmaker) for outcome in OUTCOMES
+        })
+        # Ensure that odds and probabilities columns are numeric
+        indexed.append(df.apply(pd.to_numeric, errors='coerce'))
+
+    # Align every source on the integer match ID, then attach the fixture
+    df_combined = pd.concat(indexed, axis=1, join=join).sort_index()
+    df_combined = pd.concat([
+        match_index.fixtures(df_combined.index).set_index(df_combined.index),
+        df_combined
+    ], axis=1).reset_index()
+
+    # Calculate average odds and probabilities
+    average_columns = []
+    for kind, column_for in (('Odds', odds_column), ('Probability', probability_column)):
+        for outcome in OUTCOMES:
+            column = f'Average {outcome} {kind}'
+            df_combined[column] = df_combined[
+                [column_for(outcome, bookmaker) for bookmaker in bookmakers]
+            ].mean(axis=1, skipna=True)
+            average_columns.append(column)
+
+    # Round all numerical columns to two decimal places
+    numeric_columns = odds_columns(bookmakers) + probability_columns(bookmakers) + average_columns
+    df_combined[numeric_columns] = df_combined[numeric_columns].round(2)
+
+    return df_combined
+
+
+def to_long(df_combined):
+    """Melt the wide combined layout to one row per (match, bookmaker, outcome)."""
+    frames = []
+    for bookmaker in bookmakers_in(df_combined):
+        for outcome in OUTCOMES:
+            probability = probability_column(outcome, bookmaker)
+            frames.append(pd.DataFrame({
+                'Home Team': df_combined['Home Team'],
+                'Away Team': df_combined['Away Team'],
+                'Bookmaker': bookmaker,
+                'Outcome': outcome,
+                'Odds': pd.to_numeric(df_combined[odds_column(outcome, bookmaker)], errors='coerce'),
+                'Probability': pd.to_numeric(df_combined[probability], errors='coerce')
+                if probability in df_combined.columns else float('nan')
+            }))
+    if not frames:
+        return pd.DataFrame(columns=MATCH_KEYS + ['Bookmaker', 'Outcome', 'Odds', 'Probability'])
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,70 @@
+import pandas as pd
+
+from bookmakers import MATCH_KEYS, to_long
+
+# Columns identifying a single price
+PRICE_KEYS = MATCH_KEYS + ['Bookmaker', 'Outcome']
+
+
+def match_labels(df):
+    """The 'Home vs Away' label the EV and arbitrage outputs use for a match."""
+    return df['Home Team'].astype(str) + ' vs ' + df['Away Team'].astype(str)
+
+
+def diff_snapshots(previous, current):
+    """
+    Compare two combined snapshots and return only the prices that changed,
+    appeared or disappeared, with their 'Previous Odds' and current 'Odds'.
+    """
+    current_long = to_long(current).dropna(subset=MATCH_KEYS)
+    if previous is None:
+        changes = current_long.assign(**{'Previous Odds': float('nan')})
+    else:
+        previous_long = to_long(previous).dropna(subset=MATCH_KEYS)
+        merged = pd.merge(
+            previous_long[PRICE_KEYS + ['Odds']].drop_duplicates(subset=PRICE_KEYS),
+            current_long.drop_duplicates(subset=PRICE_KEYS),
+            on=PRICE_KEYS, how='outer', suffixes=('_previous', '')
+        ).rename(columns={'Odds_previous': 'Previous Odds'})
+
+        before, after = merged['Previous Odds'], merged['Odds']
+        moved = (before != after) & ~(before.isna() & after.isna())
+        changes = merged[moved]
+
+    changes = changes[PRICE_KEYS + ['Previous Odds', 'Odds']].reset_index(drop=True)
+    changes['Match'] = match_labels(changes)
+    return changes
+
+
+class IncrementalAnalyzer:
+    """
+    Keep the latest results of match-level analyses (EV, arbitrage) and
+    recompute them only for matches whose prices changed since the last
+    snapshot.
+
+    `analyses` maps a result name to a function taking a combined frame and
+    returning a DataFrame with a 'Match' column.
+    """
+
+    def __init__(self, analyses):
+        self.analyses = analyses
+        self.previous = None
+        self.results = {name: pd.DataFrame() for name in analyses}
+
+    def update(self, df_combined):
+        """Apply a new snapshot and return the price changes it contained."""
+        changes = diff_snapshots(self.previous, df_combined)
+        changed_matches = set(changes['Match'])
+
+        if changed_matches:
+            affected = df_combined[match_labels(df_combined).isin(changed_matches)]
+            for name, analysis in self.analyses.items():
+                fresh = analysis(affected)
+                cached = self.results[name]
+                if not cached.empty:
+                    cached = cached[~cached['Match'].isin(changed_matches)]
+                frames = [frame for frame in (cached, fresh) if not frame.empty]
+                self.results[name] = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+        self.previous = df_combined
+        return changes
@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+
+from bookmakers import BOOKMAKERS, OUTCOMES
+from devig import DEFAULT_METHOD, devig
+
+
+def book_weights(bookmakers, weights=None):
+    """Weight of each bookmaker in the consensus, from `weights` or the registry."""
+    weights = weights or {}
+    return np.array([
+        weights.get(bookmaker, BOOKMAKERS.get(bookmaker, {}).get('weight', 1.0))
+        for bookmaker in bookmakers
+    ], dtype=float)
+
+
+def consensus_probabilities(odds, weights, method=DEFAULT_METHOD):
+    """
+    Blend every book's margin-free probabilities into one fair probability
+    per outcome. `odds` is a (matches x bookmakers x outcomes) array of
+    decimal odds and `weights` one weight per bookmaker. Books that don't
+    price a match are left out of its blend; matches no book prices fully
+    come back as NaN.
+    """
+    fair = devig(odds.reshape(-1, odds.shape[-1]), method).reshape(odds.shape)
+    present = np.isfinite(fair).all(axis=2, keepdims=True)
+    w = np.where(present, np.asarray(weights, dtype=float)[None, :, None], 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        blended = (np.where(present, fair, 0) * w).sum(axis=1) / w.sum(axis=1)
+        return blended / blended.sum(axis=1, keepdims=True)
+
+
+class ConsensusModel:
+    """
+    Fair probabilities per match from a weighted blend of every book, with
+    the sharp book (Pinnacle) weighted most heavily in the registry.
+
+    The result for each match is cached with the prices it was built from,
+    and only matches with a changed price (or new matches) are recomputed
+    on the next call.
+    """
+
+    def __init__(self, weights=None, method=DEFAULT_METHOD):
+        self.weights = weights
+        self.method = method
+        self.recomputed = 0
+        self._bookmakers = None
+        self._keys = pd.Index([])
+        self._odds = np.empty((0, 0))
+        self._fair = np.empty((0, len(OUTCOMES)))
+
+    def fair_probabilities(self, keys, odds, bookmakers):
+        """
+        Return (matches x outcomes) fair probabilities for `odds`, a
+        (matches x bookmakers x outcomes) array whose rows are identified
+        by `keys` (e.g. match labels).
+        """
+        keys = pd.Index(keys)
+        flat = odds.reshape(len(keys), -1)
+        fair = np.full((len(keys), len(OUTCOMES)), np.nan)
+        stale = np.ones(len(keys), dtype=bool)
+
+        if list(bookmakers) == self._bookmakers and keys.is_unique and self._keys.is_unique:
+            position = self._keys.get_indexer(keys)
+            hit = np.nonzero(position >= 0)[0]
+            cached = self._odds[position[hit]]
+            same = ((cached == flat[hit]) | (np.isnan(cached) & np.isnan(flat[hit]))).all(axis=1)
+            fresh = hit[same]
+            fair[fresh] = self._fair[position[fresh]]
+            stale[fresh] = False
+
+        if stale.any():
+            fair[stale] = consensus_probabilities(
+                odds[stale], book_weights(bookmakers, self.weights), self.method)
+        self.recomputed = int(stale.sum())
+
+        # Keep exactly the current matches, so finished ones drop out
+        self._bookmakers = list(bookmakers)
+        self._keys, self._odds, self._fair = keys, flat.copy(), fair.copy()
+        return fair
+
+
+# Shared model, so repeated EV runs in one process reuse unchanged matches
+CONSENSUS = ConsensusModel()
@@ -0,0 +1,296 @@
+import argparse
+import os
+import random
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+# EV lives in visualization/ and arbitrage.py one directory up
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, 'visualization'))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from arbitrage import BANKROLL, find_arbitrage_opportunities
+from bookmakers import combine_bookmakers, load_scrapers
+from changes import IncrementalAnalyzer, diff_snapshots
+from EV import find_expected_values
+from history import DEFAULT_HISTORY_PATH, OddsHistory
+from match_index import KICKOFF_COLUMN, coverage_report, print_coverage
+from snapshot import DEFAULT_SNAPSHOT_PATH, read_snapshot, write_snapshot
+from stakes import arbitrage_stakes
+
+# Where the analysis handler writes each result table
+RESULT_PATHS = {
+    'ev': 'expected_values.csv',
+    'arbitrage': 'arbitrage_opportunities.csv'
+}
+
+
+class ScrapeDaemon:
+    """
+    Keep scraping every bookmaker on its own adaptive interval.
+
+    A book is polled faster while its prices keep moving and when a listed
+    match is close to kickoff, and slower while nothing changes. Each run is
+    jittered, a book that is still running when it comes due is skipped,
+    and browsers and connections stay warm because the process never exits
+    between runs. After every scrape the combined snapshot is rebuilt from
+    the latest frame of every book and handed to `on_snapshot`; each book's
+    own frame is handed to `on_result(name, df)` first, as soon as it lands.
+
+    A book that fails is polled less and less often. Its last good frame is
+    dropped from the combined snapshot after `max_failures` failures in a
+    row, or once it is older than `max_age` seconds (default: twice the
+    longest interval), so stale prices never feed EV, arbitrage or alerts.
+    """
+
+    def __init__(self, bookmakers=None, base_interval=300, min_interval=30,
+                 max_interval=1800, jitter=0.1, on_snapshot=None, on_result=None,
+                 history_path=DEFAULT_HISTORY_PATH, max_failures=3, max_age=None):
+        self.scrapers = load_scrapers(bookmakers)
+        self.base_interval = base_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.jitter = jitter
+        self.max_failures = max_failures
+        self.max_age = max_age if max_age is not None else 2 * max_interval
+        self.on_snapshot = on_snapshot or SnapshotAnalyzer()
+        self.on_result = on_result
+        self.history = OddsHistory(history_path)
+
+        now = time.monotonic()
+        self.state = {
+            name: {'next_run': now, 'interval': base_interval, 'running': False,
+                   'df': None, 'scraped_at': None, 'failures': 0}
+            for name in self.scrapers
+        }
+        self._lock = threading.Lock()
+        # Serialises everything that touches the match index (interval
+        # diffs, result handlers, combining) and history writes across books
+        self._index_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=len(self.scrapers))
+
+    def _kickoff_interval(self, df):
+        """Upper bound on the interval given the nearest upcoming kickoff."""
+        if KICKOFF_COLUMN not in df.columns:
+            return self.max_interval
+        kickoffs = pd.to_datetime(df[KICKOFF_COLUMN], errors='coerce', utc=True)
+        upcoming = kickoffs[kickoffs > pd.Timestamp.now(tz='UTC')]
+        if upcoming.empty:
+            return self.max_interval
+        hours = (upcoming.min() - pd.Timestamp.now(tz='UTC')).total_seconds() / 3600
+        if hours <= 1:
+            return self.min_interval
+        if hours <= 24:
+            return self.base_interval
+        return self.max_interval
+
+    def _next_interval(self, name, previous, df):
+        """Shrink the interval while prices move, grow it while they don't."""
+        interval = self.state[name]['interval']
+        if previous is not None:
+            changes = diff_snapshots(combine_bookmakers({name: previous}), combine_bookmakers({name: df}))
+            total = max(1, len(df) * 3)
+            if len(changes):
+                # The more of the book that moved, the faster we poll
+                interval *= max(0.25, 1 - len(changes) / total)
+            else:
+                interval *= 1.5
+        interval = min(interval, self._kickoff_interval(df))
+        return max(self.min_interval, min(self.max_interval, interval))
+
+    def _schedule(self, name, interval):
+        # Jitter keeps books from synchronising and polls from looking robotic
+        delay = interval * (1 + random.uniform(-self.jitter, self.jitter))
+        self.state[name]['next_run'] = time.monotonic() + delay
+        self.state[name]['interval'] = interval
+
+    def _fresh_frames(self):
+        """Every book's last good frame that has not expired (call under _lock)."""
+        now = time.monotonic()
+        frames = {}
+        for book, state in self.state.items():
+            if state['df'] is None:
+                continue
+            if now - state['scraped_at'] > self.max_age:
+                print(f"{book}: last prices are {now - state['scraped_at']:.0f}s old, dropping them")
+                state['df'] = None
+                continue
+            frames[book] = state['df']
+        return frames
+
+    def _run(self, name):
+        start = time.perf_counter()
+        try:
+            df = self.scrapers[name]()
+            error = None
+        except Exception as e:
+            df, error = None, e
+        elapsed = time.perf_counter() - start
+
+        if error is not None or df is None or df.empty:
+            self._failed(name, elapsed, error)
+            return
+
+        with self._index_lock:
+            with self._lock:
+                previous = self.state[name]['df']
+            interval = self._next_interval(name, previous, df)
+
+            with self._lock:
+                state = self.state[name]
+                state['running'] = False
+                state['df'] = df
+                state['scraped_at'] = time.monotonic()
+                state['failures'] = 0
+                self._schedule(name, interval)
+                frames = self._fresh_frames()
+                print(f"{name}: {len(df)} rows in {elapsed:.1f}s, next run in {state['interval']:.0f}s")
+            self._wake.set()
+
+            self._handle_result(name, df)
+            self.history.append({name: df})
+            if len(frames) >= 2:
+                df_combined = combine_bookmakers(frames)
+                if not df_combined.empty:
+                    print_coverage(coverage_report(df_combined, list(frames)), len(df_combined))
+                    self.on_snapshot(df_combined)
+
+    def _failed(self, name, elapsed, error):
+        """Back a failing book off, and drop its prices once it keeps failing."""
+        with self._lock:
+            state = self.state[name]
+            state['running'] = False
+            state['failures'] += 1
+            print(f"{name}: no data in {elapsed:.1f}s" + (f" ({error})" if error else "")
+                  + f", {state['failures']} failure(s) in a row")
+            self._schedule(name, min(self.max_interval, state['interval'] * 2))
+            stale = state['df'] if state['failures'] >= self.max_failures else None
+            if stale is not None:
+                print(f"{name}: dropping its last prices after {state['failures']} failures")
+                state['df'] = None
+        self._wake.set()
+
+        if stale is not None:
+            # An empty frame tells result handlers the book lists nothing now
+            with self._index_lock:
+                self._handle_result(name, stale.iloc[0:0])
+
+    def _handle_result(self, name, df):
+        if self.on_result is not None:
+            try:
+                self.on_result(name, df)
+            except Exception as e:
+                print(f"{name}: result handler failed ({e})")
+
+    def run(self):
+        """Run until SIGINT/SIGTERM (or stop()), then let in-flight scrapes finish."""
+        # Signal handlers can only be installed from the main thread
+        if threading.current_thread() is threading.main_thread():
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(sig, lambda *_: self.stop())
+
+        print(f"Scraping {', '.join(self.scrapers)}; press Ctrl+C to stop")
+        while not self._stopping.is_set():
+            now = time.monotonic()
+            with self._lock:
+                for name, state in self.state.items():
+                    if state['next_run'] > now:
+                        continue
+                    if state['running']:
+                        # Skip this slot rather than pile up runs of a slow book
+                        print(f"{name}: still running, skipping this run")
+                        self._schedule(name, state['interval'])
+                        continue
+                    state['running'] = True
+                    # Tentative slot; replaced when the run finishes
+                    self._schedule(name, state['interval'])
+                    self._executor.submit(self._run, name)
+                next_due = min(state['next_run'] for state in self.state.values())
+
+            # Sleep until the next book is due or a run finishes
+            self._wake.wait(timeout=max(0.0, min(next_due - time.monotonic(), 60)))
+            self._wake.clear()
+
+        print("Stopping: waiting for running scrapes to finish")
+        self._executor.shutdown(wait=True)
+        self.history.close()
+
+    def stop(self):
+        self._stopping.set()
+        self._wake.set()
+
+
+def save_snapshot(df_combined, path=DEFAULT_SNAPSHOT_PATH):
+    """Save-only snapshot handler: report changes and replace the saved snapshot."""
+    try:
+        previous = read_snapshot(path)
+    except FileNotFoundError:
+        previous = None
+    except ValueError as e:
+        print(f"Not diffing against the saved snapshot: {e}")
+        previous = None
+    changes = diff_snapshots(previous, df_combined)
+    path = write_snapshot(df_combined, path)
+    print(f"Snapshot saved to '{path}' ({len(changes)} prices changed)")
+
+
+class SnapshotAnalyzer:
+    """
+    Default snapshot handler: save the snapshot, then rerun EV and arbitrage
+    only for the matches whose prices moved since the previous snapshot and
+    save the updated result tables.
+    """
+
+    def __init__(self, path=DEFAULT_SNAPSHOT_PATH, result_paths=RESULT_PATHS):
+        self.path = path
+        self.result_paths = result_paths
+        self.analyzer = IncrementalAnalyzer({
+            'ev': find_expected_values,
+            'arbitrage': find_arbitrage_opportunities
+        })
+
+    def __call__(self, df_combined):
+        changes = self.analyzer.update(df_combined)
+        path = write_snapshot(df_combined, self.path)
+        print(f"Snapshot saved to '{path}' ({len(changes)} prices changed "
+              f"across {changes['Match'].nunique()} matches)")
+        if changes.empty:
+            return
+
+        results = dict(self.analyzer.results)
+        if not results['arbitrage'].empty:
+            # Stakes share one bankroll, so they are sized over every opportunity
+            results['arbitrage'] = arbitrage_stakes(results['arbitrage'], bankroll=BANKROLL)
+        for name, df in results.items():
+            df.to_csv(self.result_paths[name], index=False)
+            print(f"{len(df)} {name} rows saved to '{self.result_paths[name]}'")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape every bookmaker on an adaptive schedule.")
+    parser.add_argument('--interval', type=float, default=300, help="starting interval in seconds")
+    parser.add_argument('--min-interval', type=float, default=30)
+    parser.add_argument('--max-interval', type=float, default=1800)
+    parser.add_argument('--jitter', type=float, default=0.1, help="relative random jitter per run")
+    parser.add_argument('--max-failures', type=int, default=3,
+                        help="failures in a row before a book's last prices are dropped")
+    args = parser.parse_args()
+
+    ScrapeDaemon(
+        base_interval=args.interval,
+        min_interval=args.min_interval,
+        max_interval=args.max_interval,
+        jitter=args.jitter,
+        max_failures=args.max_failures
+    ).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+import numpy as np
+
+from odds_format import decimal_to_probability
+
+
+def _bisect(excess, lo, hi, iterations=60, tolerance=1e-10):
+    """
+    Solve excess(x) = 0 for every row at once, where `excess` is decreasing
+    in x and lo/hi are per-row brackets. Rows stop moving once every row is
+    within `tolerance`.
+    """
+    lo, hi = lo.copy(), hi.copy()
+    for _ in range(iterations):
+        mid = (lo + hi) / 2
+        above = excess(mid) > 0
+        lo = np.where(above, mid, lo)
+        hi = np.where(above, hi, mid)
+        if np.nanmax(hi - lo, initial=0) < tolerance:
+            break
+    return (lo + hi) / 2
+
+
+def proportional(implied):
+    """Scale every outcome by the same factor."""
+    return implied / implied.sum(axis=1, keepdims=True)
+
+
+def power(implied):
+    """Raise every implied probability to the power k that makes them sum to 1."""
+    def excess(k):
+        return (implied ** k[:, None]).sum(axis=1) - 1
+
+    n = len(implied)
+    k = _bisect(excess, np.full(n, 1e-3), np.full(n, 50.0))
+    return implied ** k[:, None]
+
+
+def shin(implied):
+    """
+    Shin's method: assume a share z of the money comes from insiders and
+    solve for the z that makes the fair probabilities sum to 1. It moves
+    more of the margin off longshots than off favourites.
+    """
+    total = implied.sum(axis=1, keepdims=True)
+
+    def fair(z):
+        z = z[:, None]
+        return (np.sqrt(z ** 2 + 4 * (1 - z) * implied ** 2 / total) - z) / (2 * (1 - z))
+
+    n = len(implied)
+    z = _bisect(lambda z: fair(z).sum(axis=1) - 1, np.zeros(n), np.full(n, 0.999))
+    probabilities = fair(z)
+    # No insider share explains a book under 100%; fall back to scaling
+    return np.where(total > 1, probabilities, proportional(implied))
+
+
+def odds_ratio(implied):
+    """Divide every outcome's odds ratio by the same constant c."""
+    def fair(log_c):
+        c = np.exp(log_c)[:, None]
+        return implied / (c + implied - c * implied)
+
+    n = len(implied)
+    log_c = _bisect(lambda log_c: fair(log_c).sum(axis=1) - 1, np.full(n, -10.0), np.full(n, 10.0))
+    return fair(log_c)
+
+
+METHODS = {
+    'proportional': proportional,
+    'power': power,
+    'shin': shin,
+    'odds_ratio': odds_ratio
+}
+
+# Used by the scrapers and the live alert stream
+DEFAULT_METHOD = 'shin'
+
+
+def devig(odds, method=DEFAULT_METHOD):
+    """
+    Return margin-free probabilities (0-1) for an (N matches x outcomes)
+    array of decimal odds, solving every match at once. Rows missing a
+    price come back as NaN.
+    """
+    implied = np.atleast_2d(decimal_to_probability(odds))
+    probabilities = np.full(implied.shape, np.nan)
+    complete = np.isfinite(implied).all(axis=1)
+    if complete.any():
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            probabilities[complete] = METHODS[method](implied[complete])
+    return probabilities
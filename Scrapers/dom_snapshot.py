@@ -0,0 +1,29 @@
+# Collect the visible text of every team and price element of every row, and
+# its kickoff text, in one pass, returning [[team texts], [price texts],
+# kickoff text or null] per row
+_ROWS_SNAPSHOT_JS = """
+const [rowSelector, teamSelector, priceSelector, kickoffSelector] = arguments;
+const texts = (row, selector) =>
+    Array.from(row.querySelectorAll(selector), el => el.innerText.trim());
+const kickoff = row => {
+    if (!kickoffSelector) return null;
+    const el = row.querySelector(kickoffSelector);
+    return el ? (el.getAttribute("datetime") || el.innerText.trim()) : null;
+};
+return Array.from(document.querySelectorAll(rowSelector), row => [
+    texts(row, teamSelector),
+    texts(row, priceSelector),
+    kickoff(row)
+]);
+"""
+
+
+def snapshot_rows(driver, row_selector, team_selector, price_selector, kickoff_selector=None):
+    """
+    Read all team names, prices and kickoff times on the page with a single
+    WebDriver call. Returns a list of (team texts, price texts, kickoff text
+    or None) tuples, one per row.
+    """
+    rows = driver.execute_script(
+        _ROWS_SNAPSHOT_JS, row_selector, team_selector, price_selector, kickoff_selector)
+    return [(teams, prices, kickoff) for teams, prices, kickoff in rows or []]
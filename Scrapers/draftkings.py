@@ -1,61 +1,12 @@
+import numpy as np
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
-import schedule
-import time
-
-
-TEAM_NAME_MAPPING = {
-    "Man Utd": "Manchester United",
-    "Chelsea": "Chelsea",
-    "Fulham": "Fulham",
-    "Brentford": "Brentford",
-    "West Ham": "West Ham United",
-    "Everton": "Everton",
-    "Wolves": "Wolverhampton Wanderers",
-    "Southampton": "Southampton",
-    "Crystal Palace": "Crystal Palace",
-    "Bournemouth": "AFC Bournemouth",
-    "Brighton": "Brighton & Hove Albion",
-    "Man City": "Manchester City",
-    "Liverpool": "Liverpool",
-    "Aston Villa": "Aston Villa",
-    "Tottenham": "Tottenham Hotspur",
-    "Ipswich": "Ipswich Town",
-    "Leicester": "Leicester City",
-    "Nottingham Forest": "Nottingham Forest",
-    "Newcastle": "Newcastle United",
-    "Arsenal": "Arsenal"
-}
-
-
-def normalize_team_name(team_name):
-    """Normalize team names using the TEAM_NAME_MAPPING dictionary."""
-    # Strip any extra whitespace and use the dictionary to normalize
-    normalized_name = team_name.strip()
-    return TEAM_NAME_MAPPING.get(normalized_name, normalized_name)
-
-
-def clean_odds(odds_text):
-    # Remove any non-numeric characters (like commas or whitespace)
-    cleaned_text = ''.join(filter(str.isdigit, odds_text))
-    return int(cleaned_text) if cleaned_text else None
-
-
-def american_odds_to_probability(odds):
-    """Convert American odds to implied probability."""
-    odds = int(odds)
-    if odds > 0:  # Positive American odds
-        probability = 100 / (odds + 100)
-    else:  # Negative American odds
-        probability = -odds / (-odds + 100)
-    return probability
-
-
-def normalize_probabilities(probabilities):
-    """Normalize a list of probabilities to sum to 1 (or 100%)."""
-    total_probability = sum(probabilities)
-    return [p / total_probability for p in probabilities]
+from bookmakers import OUTCOMES
+from devig import devig
+from history import OddsHistory
+from odds_format import parse_odds
+from team_names import normalize_team_name
 
 
 def scrape_betting_data():
@@ -83,8 +34,11 @@ def scrape_betting_data():
     matches = soup.find_all(
         'div', class_='sportsbook-event-accordion__wrapper')
 
-    # Extract information for each match
-    data = []
+    # Extract the match and its price texts; they are converted below in one pass
+    matches_found = []
+    home_teams = []
+    away_teams = []
+    odds_texts = []
     for match in matches:
         # Find the teams (they seem to be inside <a> tags with the class 'sportsbook-event-accordion__title')
         teams = match.find(
@@ -93,60 +47,62 @@ def scrape_betting_data():
         # Normalize the team names
         team_names = teams.split("vs")
         if len(team_names) == 2:
-            team1 = normalize_team_name(team_names[0].strip())
-            team2 = normalize_team_name(team_names[1].strip())
+            team1 = normalize_team_name(team_names[0], 'draftkings')
+            team2 = normalize_team_name(team_names[1], 'draftkings')
             teams = f"{team1} vs {team2}"
         else:
-            teams = normalize_team_name(teams)
+            teams = normalize_team_name(teams, 'draftkings')
+            team1 = team2 = None
 
         # Find the odds (e.g., stored inside spans or other tags)
         # Update the class if necessary
         odds_elements = match.find_all('span', class_='sportsbook-odds')
+        matches_found.append(teams)
+        home_teams.append(team1)
+        away_teams.append(team2)
         if len(odds_elements) >= 3:
-            try:
-
-                # Convert odds to integers
-                team1_odds = clean_odds(odds_elements[0].text.strip())
-                draw_odds = clean_odds(odds_elements[1].text.strip())
-                team2_odds = clean_odds(odds_elements[2].text.strip())
-
-                # Convert American odds to implied probabilities
-                team1_prob = american_odds_to_probability(team1_odds)
-                draw_prob = american_odds_to_probability(draw_odds)
-                team2_prob = american_odds_to_probability(team2_odds)
-
-                # Normalize the probabilities
-                normalized_probs = normalize_probabilities(
-                    [team1_prob, draw_prob, team2_prob])
-
-                # Append the result to the data list
-                data.append([teams, team1_odds, draw_odds,
-                            team2_odds] + normalized_probs)
-            except ValueError:
-                # Handle the case where odds are not valid integers
-                data.append([teams, 'N/A', 'N/A', 'N/A', 'N/A', 'N/A', 'N/A'])
+            odds_texts.append([odds.text.strip() for odds in odds_elements[:3]])
         else:
-            data.append([teams, 'N/A', 'N/A', 'N/A', 'N/A', 'N/A', 'N/A'])
+            odds_texts.append([None] * 3)
+
+    # Parse the American prices to decimal odds and remove the margin, like
+    # every other scraper (unparseable prices become NaN)
+    odds = parse_odds(np.ravel(odds_texts), 'american').reshape(-1, 3)
+    probabilities = devig(odds)
 
     # Store data in a DataFrame and output
-    df = pd.DataFrame(data, columns=['Match', 'Team 1 Odds', 'Draw Odds', 'Team 2 Odds',
-                      'Normalized Team 1 Prob', 'Normalized Draw Prob', 'Normalized Team 2 Prob'])
+    df = pd.DataFrame({
+        'Match': matches_found,
+        'Team 1 Odds': odds[:, 0],
+        'Draw Odds': odds[:, 1],
+        'Team 2 Odds': odds[:, 2],
+        'Normalized Team 1 Prob': probabilities[:, 0],
+        'Normalized Draw Prob': probabilities[:, 1],
+        'Normalized Team 2 Prob': probabilities[:, 2]
+    })
     print(df)
 
-    # Save to CSV
+    # Save to CSV; this file only ever holds the latest scrape
     df.to_csv('data/betting_data.csv', index=False)
 
     print("Data scraped and saved!")
 
+    # Record the prices in the odds history too, in the per-source layout the
+    # other scrapers use (rows without a home and away team are left out)
+    source = pd.DataFrame({'Home Team': home_teams, 'Away Team': away_teams})
+    for i, outcome in enumerate(OUTCOMES):
+        source[f'{outcome} Odds'] = odds[:, i]
+        source[f'{outcome} Probability'] = probabilities[:, i] * 100
+    source = source.dropna(subset=['Home Team', 'Away Team'])
+    if not source.empty:
+        history = OddsHistory()
+        rows = history.append({'draftkings': source})
+        history.close()
+        print(f"Recorded {rows} prices in '{history.path}'")
+
 
 #! Run once:
 scrape_betting_data()
 
-#! Run every 5 minutes
-# # Schedule the function to run every 5 minutes
-# schedule.every(5).minutes.do(scrape_betting_data)
-
-# # Run the schedule in an infinite loop
-# while True:
-#     schedule.run_pending()
-#     time.sleep(1)
+#! Run continuously: use daemon.py, which schedules every bookmaker on an
+#! adaptive interval and keeps browsers and connections warm between runs
@@ -0,0 +1,128 @@
+from io import BytesIO
+
+from bs4 import BeautifulSoup
+
+try:
+    from lxml import etree
+except ImportError:  # Fall back to BeautifulSoup's pure-Python parser
+    etree = None
+
+EVENT_CLASS = 'sportsbook-event-accordion__wrapper'
+TITLE_CLASS = 'sportsbook-event-accordion__title'
+ODDS_CLASS = 'sportsbook-odds'
+DATE_CLASS = 'sportsbook-event-accordion__date'
+
+
+def _class_test(tag, css_class):
+    return f"//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {css_class} ')]"
+
+
+if etree is not None:
+    # DraftKings serves UTF-8; lxml would otherwise assume latin-1 without a meta tag
+    _HTML_PARSER = etree.HTMLParser(encoding='utf-8')
+    _EVENTS = etree.XPath(_class_test('div', EVENT_CLASS))
+    _TITLE = etree.XPath('.' + _class_test('a', TITLE_CLASS))
+    _ODDS = etree.XPath('.' + _class_test('span', ODDS_CLASS))
+    _DATE = etree.XPath('.' + _class_test('*', DATE_CLASS))
+
+
+def _has_class(element, css_class):
+    return css_class in (element.get('class') or '').split()
+
+
+def _text(element):
+    return ''.join(element.itertext()).strip()
+
+
+def extract_events_stream(content):
+    """
+    Stream the page and keep only event titles, kickoffs and odds, discarding each
+    event's elements once read so memory stays flat on very large pages.
+    """
+    events = []
+    depth = 0
+    title = None
+    kickoff = None
+    odds = []
+    for event, element in etree.iterparse(
+            BytesIO(content), events=('start', 'end'), html=True, encoding='utf-8'):
+        if event == 'start':
+            if element.tag == 'div' and _has_class(element, EVENT_CLASS):
+                depth += 1
+                if depth == 1:
+                    title, kickoff, odds = None, None, []
+            continue
+
+        if depth:
+            if element.tag == 'a' and title is None and _has_class(element, TITLE_CLASS):
+                title = _text(element)
+            elif kickoff is None and _has_class(element, DATE_CLASS):
+                kickoff = _text(element)
+            elif element.tag == 'span' and _has_class(element, ODDS_CLASS):
+                odds.append(_text(element))
+            elif element.tag == 'div' and _has_class(element, EVENT_CLASS):
+                depth -= 1
+                if depth == 0:
+                    if title is not None:
+                        events.append((title, odds, kickoff))
+                    # Drop the finished event and anything parsed before it
+                    element.clear()
+                    while element.getprevious() is not None:
+                        del element.getparent()[0]
+    return events
+
+
+def extract_events_xpath(content):
+    """Parse the page with lxml and pull events with compiled XPath queries."""
+    tree = etree.HTML(content, parser=_HTML_PARSER)
+    if tree is None:
+        return []
+    events = []
+    for element in _EVENTS(tree):
+        titles = _TITLE(element)
+        if titles:
+            dates = _DATE(element)
+            events.append((
+                _text(titles[0]),
+                [_text(odd) for odd in _ODDS(element)],
+                _text(dates[0]) if dates else None
+            ))
+    return events
+
+
+def extract_events_bs4(content):
+    """The original BeautifulSoup path, kept as a fallback and benchmark baseline."""
+    soup = BeautifulSoup(content, 'html.parser')
+    events = []
+    for match in soup.find_all('div', class_=EVENT_CLASS):
+        title = match.find('a', class_=TITLE_CLASS)
+        if title is not None:
+            date = match.find(class_=DATE_CLASS)
+            events.append((
+                title.text.strip(),
+                [odd.text.strip() for odd in match.find_all('span', class_=ODDS_CLASS)],
+                date.text.strip() if date is not None else None
+            ))
+    return events
+
+
+BACKENDS = {
+    'stream': extract_events_stream,
+    'xpath': extract_events_xpath,
+    'bs4': extract_events_bs4
+}
+
+# Fastest available backend
+DEFAULT_BACKEND = 'xpath' if etree is not None else 'bs4'
+
+
+def extract_events(content, backend=DEFAULT_BACKEND):
+    """
+    Return (title text, [odds texts], kickoff text or None) for every event
+    on a DraftKings page.
+    """
+    if etree is None and backend != 'bs4':
+        backend = 'bs4'
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    return BACKENDS[backend](content)
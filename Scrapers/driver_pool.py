@@ -0,0 +1,116 @@
+import atexit
+import queue
+import threading
+from contextlib import contextmanager
+
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+
+class ChromePool:
+    """
+    Keep warm headless Chrome drivers alive across scrape cycles.
+
+    Drivers are health-checked before every checkout and recycled after
+    `max_uses` checkouts or as soon as a WebDriver call fails inside one.
+    """
+
+    def __init__(self, size=2, max_uses=50, headless=True):
+        self.size = size
+        self.max_uses = max_uses
+        self.headless = headless
+        self._idle = queue.LifoQueue()
+        self._uses = {}
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(size)
+        self._driver_path = None
+        atexit.register(self.close)
+
+    def _resolve_driver_path(self):
+        # Resolve the chromedriver binary once per process, not per scrape
+        with self._lock:
+            if self._driver_path is None:
+                self._driver_path = ChromeDriverManager().install()
+            return self._driver_path
+
+    def _create(self):
+        options = Options()
+        if self.headless:
+            options.add_argument("--headless")  # Run in headless mode
+        driver = webdriver.Chrome(service=Service(self._resolve_driver_path()), options=options)
+        with self._lock:
+            self._uses[driver] = 0
+        return driver
+
+    def _discard(self, driver):
+        with self._lock:
+            self._uses.pop(driver, None)
+        try:
+            driver.quit()
+        except Exception:
+            pass  # Already dead
+
+    @staticmethod
+    def _healthy(driver):
+        """Check the browser still answers a trivial script."""
+        try:
+            return driver.execute_script("return 1") == 1
+        except WebDriverException:
+            return False
+
+    def _acquire(self):
+        # Reuse the most recently returned driver, or start one if none are idle
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return self._create()
+
+            if self._healthy(driver):
+                return driver
+            print("Discarding unresponsive Chrome driver")
+            self._discard(driver)
+
+    def _release(self, driver, crashed):
+        with self._lock:
+            self._uses[driver] = self._uses.get(driver, 0) + 1
+            worn_out = self._uses[driver] >= self.max_uses
+
+        if crashed or worn_out:
+            self._discard(driver)
+        else:
+            self._idle.put(driver)
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """Check out a warm driver for the duration of a `with` block."""
+        # At most `size` drivers are checked out (and so alive) at once
+        if not self._slots.acquire(timeout=timeout):
+            raise TimeoutError("No Chrome driver became available")
+        try:
+            driver = self._acquire()
+        except Exception:
+            self._slots.release()
+            raise
+
+        crashed = False
+        try:
+            yield driver
+        except WebDriverException:
+            crashed = True
+            raise
+        finally:
+            self._release(driver, crashed)
+            self._slots.release()
+
+    def close(self):
+        """Quit every idle driver."""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
@@ -0,0 +1,120 @@
+import sqlite3
+import time
+
+import pandas as pd
+
+from bookmakers import OUTCOMES
+
+# Default location of the odds history database
+DEFAULT_HISTORY_PATH = 'odds_history.sqlite'
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS odds_history (
+    scraped_at REAL NOT NULL,
+    home_team TEXT NOT NULL,
+    away_team TEXT NOT NULL,
+    bookmaker TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    odds REAL,
+    probability REAL
+);
+CREATE INDEX IF NOT EXISTS idx_odds_history_time
+    ON odds_history (scraped_at);
+CREATE INDEX IF NOT EXISTS idx_odds_history_key
+    ON odds_history (home_team, away_team, bookmaker, outcome, scraped_at);
+"""
+
+
+def _to_epoch(value):
+    """Accept epoch seconds, datetimes or date strings for range queries."""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    timestamp = pd.Timestamp(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.tz_localize('UTC')
+    return timestamp.timestamp()
+
+
+class OddsHistory:
+    """
+    Append-only store of every scraped price, keyed by scrape time, match,
+    bookmaker and outcome.
+    """
+
+    def __init__(self, path=DEFAULT_HISTORY_PATH):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL lets readers query while a scrape cycle is being appended
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(_SCHEMA)
+
+    def append(self, frames, scraped_at=None):
+        """
+        Record one scrape cycle. `frames` maps a bookmaker name to the
+        per-source DataFrame its scraper returned. Returns the rows written.
+        """
+        scraped_at = time.time() if scraped_at is None else _to_epoch(scraped_at)
+
+        records = []
+        for bookmaker, df in frames.items():
+            for outcome in OUTCOMES:
+                odds = pd.to_numeric(df[f'{outcome} Odds'], errors='coerce')
+                probability = pd.to_numeric(df[f'{outcome} Probability'], errors='coerce')
+                records.extend(zip(
+                    [scraped_at] * len(df),
+                    df['Home Team'],
+                    df['Away Team'],
+                    [bookmaker] * len(df),
+                    [outcome] * len(df),
+                    odds.astype(object).where(odds.notna(), None),
+                    probability.astype(object).where(probability.notna(), None)
+                ))
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO odds_history VALUES (?, ?, ?, ?, ?, ?, ?)", records)
+        return len(records)
+
+    def query(self, start=None, end=None, home_team=None, away_team=None,
+              bookmaker=None, outcome=None):
+        """Return every recorded price in [start, end) matching the filters."""
+        clauses, params = [], []
+        for column, operator, value in (
+            ('scraped_at', '>=', _to_epoch(start)),
+            ('scraped_at', '<', _to_epoch(end)),
+            ('home_team', '=', home_team),
+            ('away_team', '=', away_team),
+            ('bookmaker', '=', bookmaker),
+            ('outcome', '=', outcome)
+        ):
+            if value is not None:
+                clauses.append(f"{column} {operator} ?")
+                params.append(value)
+
+        sql = "SELECT * FROM odds_history"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY scraped_at"
+        return self._read(sql, params)
+
+    def closing_prices(self, before=None):
+        """Return the last recorded price per (match, bookmaker, outcome) before a time."""
+        sql = """
+            SELECT h.* FROM odds_history h
+            JOIN (
+                SELECT home_team, away_team, bookmaker, outcome, MAX(scraped_at) AS scraped_at
+                FROM odds_history
+                WHERE scraped_at < ?
+                GROUP BY home_team, away_team, bookmaker, outcome
+            ) last USING (home_team, away_team, bookmaker, outcome, scraped_at)
+        """
+        before = _to_epoch(before)
+        return self._read(sql, [float('inf') if before is None else before])
+
+    def _read(self, sql, params):
+        df = pd.read_sql_query(sql, self.conn, params=params)
+        df['scraped_at'] = pd.to_datetime(df['scraped_at'], unit='s', utc=True)
+        return df
+
+    def close(self):
+        self.conn.close()
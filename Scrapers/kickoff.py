@@ -0,0 +1,120 @@
+import re
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+from dateutil import parser as date_parser
+
+# Words a page prints instead of a date
+_RELATIVE_DAYS = {'today': 0, 'tonight': 0, 'tomorrow': 1}
+
+# "Starting in 25 min", "Starts in 1h", "in 5 minutes"
+_STARTS_IN = re.compile(r'in\s+(\d+)\s*(m|min|mins|minutes?|h|hr|hrs|hours?)\b')
+
+# Weekday names (resolved to their next occurrence) and date ordinals
+# dateutil trips over ("SAT 19TH OCT")
+_WEEKDAY = re.compile(r'\b(mon|tue|wed|thu|fri|sat|sun)[a-z]*\b,?')
+_WEEKDAYS = ['mon', 'tue', 'wed', 'thu', 'fri', 'sat', 'sun']
+_ORDINAL = re.compile(r'\b(\d{1,2})(st|nd|rd|th)\b')
+
+# A printed calendar date: "19 oct", "oct 19", "10/20/24", "20.10."
+_MONTH = re.compile(r'\b(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\b')
+_NUMERIC_DATE = re.compile(r'\d{1,2}[/.-]\d{1,2}')
+
+# A time-only kickoff this long in the past is taken to be tomorrow's
+_TIME_ONLY_GRACE = timedelta(hours=3)
+
+
+def _local_timezone():
+    return datetime.now().astimezone().tzinfo
+
+
+def _parse_one(text, timezone, now):
+    """
+    Parse one kickoff text to (UTC Timestamp or NaT, whether the page gave
+    its date). A time-only text is dated today or tomorrow by guesswork, so
+    it is flagged undated.
+    """
+    if text is None or (isinstance(text, float) and np.isnan(text)):
+        return pd.NaT, False
+    cleaned = str(text).strip().lower()
+    if not cleaned:
+        return pd.NaT, False
+    if cleaned in ('live', 'in play', 'in-play'):
+        return now.tz_convert('UTC'), True
+
+    starts_in = _STARTS_IN.search(cleaned)
+    if starts_in:
+        amount, unit = int(starts_in.group(1)), starts_in.group(2)
+        delta = timedelta(hours=amount) if unit.startswith('h') else timedelta(minutes=amount)
+        return (now + delta).tz_convert('UTC'), True
+
+    # Machine-readable times (e.g. a <time datetime="..."> attribute)
+    if re.match(r'^\d{4}-\d{2}-\d{2}', cleaned):
+        stamp = pd.to_datetime(cleaned.upper(), errors='coerce')
+        if stamp is pd.NaT:
+            return pd.NaT, False
+        return (stamp.tz_localize(timezone) if stamp.tzinfo is None else stamp).tz_convert('UTC'), True
+
+    today = now.normalize()
+    day_offset = None
+    for word, offset in _RELATIVE_DAYS.items():
+        if word in cleaned:
+            day_offset = offset
+            cleaned = cleaned.replace(word, ' ')
+    weekday = _WEEKDAY.search(cleaned)
+    cleaned = _ORDINAL.sub(r'\1', _WEEKDAY.sub(' ', cleaned))
+    cleaned = re.sub(r'[•|·@,]', ' ', cleaned).strip()
+    if not cleaned:
+        return pd.NaT, False
+
+    try:
+        parsed = date_parser.parse(cleaned, default=today.to_pydatetime().replace(tzinfo=None), fuzzy=True)
+    except (ValueError, OverflowError):
+        return pd.NaT, False
+    stamp = pd.Timestamp(parsed).tz_localize(timezone)
+
+    if _MONTH.search(cleaned) or _NUMERIC_DATE.search(cleaned):
+        if not re.search(r'\d{4}|\d{1,2}/\d{1,2}/\d{2}', cleaned) and stamp < now - timedelta(days=180):
+            # "Jan 3" read in December is next year's
+            stamp = stamp.replace(year=stamp.year + 1)
+        return stamp.tz_convert('UTC'), True
+    if day_offset is not None:
+        return (stamp + timedelta(days=day_offset)).tz_convert('UTC'), True
+    if weekday:
+        # "Monday 20:00" is the next Monday (today only if it is still to come)
+        days_ahead = (_WEEKDAYS.index(weekday.group(1)) - today.weekday()) % 7
+        stamp += timedelta(days=days_ahead)
+        if stamp < now - _TIME_ONLY_GRACE:
+            stamp += timedelta(days=7)
+        return stamp.tz_convert('UTC'), True
+
+    if stamp < now - _TIME_ONLY_GRACE:
+        stamp += timedelta(days=1)
+    return stamp.tz_convert('UTC'), False
+
+
+def parse_kickoffs(texts, timezone=None, now=None):
+    """
+    Parse kickoff texts as printed on a page ("Today 3:00 PM", "SAT 19TH OCT
+    7:30PM", "Monday 20:00", "10/20/24 • 15:00", "Starts in 25 min", "15:00"
+    or an ISO timestamp) to UTC Timestamps in one pass. Times without a zone
+    are read in `timezone` (default: this machine's). Unparseable texts
+    become NaT.
+
+    Returns (kickoffs, dated): `dated` is False where the page printed only
+    a time, so the date is a guess that must not tell fixtures apart.
+    """
+    timezone = timezone or _local_timezone()
+    now = pd.Timestamp.now(tz=timezone) if now is None else pd.Timestamp(now).tz_convert(timezone)
+    texts = pd.Series(texts, dtype=object)
+    if texts.empty:
+        return pd.Series([], dtype='datetime64[ns, UTC]'), pd.Series([], dtype=bool)
+
+    # Parse each distinct text once; a page repeats the same few kickoffs
+    codes, uniques = pd.factorize(texts.fillna(''))
+    results = [_parse_one(text, timezone, now) for text in uniques]
+    parsed = pd.to_datetime(pd.Series([stamp for stamp, _ in results], dtype=object), utc=True)
+    dated = np.array([flag for _, flag in results], dtype=bool)
+    return (pd.Series(pd.to_datetime(parsed.to_numpy()[codes], utc=True), index=texts.index),
+            pd.Series(dated[codes], index=texts.index))
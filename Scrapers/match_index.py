@@ -0,0 +1,132 @@
+import threading
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+
+# Per-source column with each match's kickoff time (UTC), from the page
+KICKOFF_COLUMN = 'Kickoff'
+# Whether the page printed the kickoff's date, rather than only a time
+KICKOFF_DATED_COLUMN = 'Kickoff Dated'
+
+# Books in different timezones can date the same kickoff a day apart
+DATE_TOLERANCE = timedelta(days=1)
+
+
+class MatchIndex:
+    """
+    Give every fixture a compact integer ID from (canonical home team,
+    canonical away team, kickoff date), so books can be joined on one int
+    column instead of re-hashing team-name strings per book.
+
+    The kickoff date only tells apart fixtures between the same two teams:
+    dates within DATE_TOLERANCE are the same fixture, and a row without a
+    kickoff joins the pair's next fixture (a dated row dates an undated one).
+    IDs are stable for the life of the index, so a long-running process
+    sees the same ID for a fixture in every snapshot. The index is shared
+    by every scraper thread, so lookups and reads hold its lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_teams = {}
+        self._team_codes = {}
+        self.teams = []
+        self._home = []
+        self._away = []
+        self._dates = []
+
+    def __len__(self):
+        with self._lock:
+            return len(self._home)
+
+    def _team_code(self, team):
+        code = self._team_codes.get(team)
+        if code is None:
+            code = self._team_codes[team] = len(self.teams)
+            self.teams.append(team)
+        return code
+
+    def _match_id(self, key):
+        home, away, date = key
+        fixtures = self._by_teams.setdefault((home, away), [])
+        if date is None:
+            if fixtures:
+                # The pair's next fixture, else its most recent one
+                cutoff = pd.Timestamp.now(tz='UTC').date() - DATE_TOLERANCE
+                upcoming = [match_id for match_id in fixtures
+                            if self._dates[match_id] is None or self._dates[match_id] >= cutoff]
+                return min(upcoming, key=lambda match_id: self._dates[match_id] or cutoff) \
+                    if upcoming else fixtures[-1]
+        else:
+            for match_id in reversed(fixtures):
+                known = self._dates[match_id]
+                if known is None:
+                    self._dates[match_id] = date
+                    return match_id
+                if abs(known - date) <= DATE_TOLERANCE:
+                    return match_id
+
+        match_id = len(self._home)
+        fixtures.append(match_id)
+        self._home.append(self._team_code(home))
+        self._away.append(self._team_code(away))
+        self._dates.append(date)
+        return match_id
+
+    def assign(self, df):
+        """
+        Return the match ID of every row of a per-source frame, dating each
+        fixture by its 'Kickoff' column when the frame has one. A kickoff
+        whose date was only inferred ('Kickoff Dated' False) is undated.
+        """
+        if KICKOFF_COLUMN in df.columns:
+            kickoffs = pd.to_datetime(df[KICKOFF_COLUMN], errors='coerce', utc=True)
+            if KICKOFF_DATED_COLUMN in df.columns:
+                kickoffs = kickoffs.where(df[KICKOFF_DATED_COLUMN].fillna(False).astype(bool))
+            dates = [None if pd.isna(kickoff) else kickoff.date() for kickoff in kickoffs]
+        else:
+            dates = [None] * len(df)
+
+        # Look each distinct fixture up once, then broadcast back to the rows
+        keys = pd.Series(list(zip(df['Home Team'], df['Away Team'], dates)), index=df.index)
+        codes, uniques = pd.factorize(keys)
+        with self._lock:
+            ids = np.array([self._match_id(key) for key in uniques], dtype=np.int64)
+        return ids[codes]
+
+    def fixtures(self, match_ids):
+        """Return Home Team / Away Team (categorical) and Kickoff Date for IDs."""
+        match_ids = np.asarray(match_ids, dtype=np.int64)
+        with self._lock:
+            home = np.asarray(self._home, dtype=np.int64)[match_ids]
+            away = np.asarray(self._away, dtype=np.int64)[match_ids]
+            dates = np.asarray(self._dates, dtype=object)[match_ids]
+            teams = list(self.teams)
+        return pd.DataFrame({
+            'Home Team': pd.Categorical.from_codes(home, categories=teams),
+            'Away Team': pd.Categorical.from_codes(away, categories=teams),
+            'Kickoff Date': dates
+        })
+
+
+# Shared index, so IDs stay stable across every snapshot of a process
+MATCH_INDEX = MatchIndex()
+
+
+def coverage_report(df_combined, bookmakers):
+    """Count how many matches each bookmaker prices, and how many are partial."""
+    priced = pd.DataFrame({
+        bookmaker: df_combined[f'Home Win Odds_{bookmaker}'].notna() for bookmaker in bookmakers
+    })
+    report = {bookmaker: int(priced[bookmaker].sum()) for bookmaker in bookmakers}
+    report['all'] = int(priced.all(axis=1).sum())
+    report['partial'] = int((~priced.all(axis=1)).sum())
+    return report
+
+
+def print_coverage(report, total):
+    per_book = ", ".join(
+        f"{name} {count}" for name, count in report.items() if name not in ('all', 'partial'))
+    print(f"{total} matches: {report['all']} priced by every book, "
+          f"{report['partial']} partial ({per_book})")
@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+
+from bookmakers import BOOKMAKERS, OUTCOMES, bookmakers_in, odds_column
+
+
+def best_prices(odds):
+    """
+    Return the best price per outcome and the bookmaker offering it, for an
+    (..., bookmakers, outcomes) array. Outcomes nobody prices are NaN with
+    bookmaker -1.
+    """
+    # Treat missing prices as unplayable so argmax never picks them
+    filled = np.where(np.isnan(odds), -np.inf, odds)
+    best_books = filled.argmax(axis=-2)
+    best_odds = np.take_along_axis(filled, np.expand_dims(best_books, -2), axis=-2).squeeze(-2)
+    missing = np.isinf(best_odds)
+    best_odds[missing] = np.nan
+    best_books[missing] = -1
+    return best_odds, best_books
+
+
+class OddsBook:
+    """
+    Decimal odds for every (match, bookmaker, outcome) in one contiguous
+    array, instead of one wide DataFrame per snapshot.
+
+    Rows are indexed by the compact match IDs from MatchIndex, so a price
+    update is a single array write. Storage doubles when a new match ID or
+    bookmaker does not fit. `odds` is a view of the filled part of the
+    array, so analyses read it without copying.
+    """
+
+    def __init__(self, bookmakers=None, capacity=256, dtype=np.float32):
+        self.bookmakers = list(bookmakers or BOOKMAKERS)
+        self._book_ids = {name: b for b, name in enumerate(self.bookmakers)}
+        self._odds = np.full((capacity, max(1, len(self.bookmakers)), len(OUTCOMES)), np.nan, dtype=dtype)
+        self.n_matches = 0
+
+    @property
+    def odds(self):
+        """(matches, bookmakers, outcomes) view of the stored prices."""
+        return self._odds[:self.n_matches, :len(self.bookmakers)]
+
+    def _grow(self, n_matches, n_books):
+        capacity, book_capacity, _ = self._odds.shape
+        if n_matches <= capacity and n_books <= book_capacity:
+            return
+        while capacity < n_matches:
+            capacity *= 2
+        while book_capacity < n_books:
+            book_capacity *= 2
+        grown = np.full((capacity, book_capacity, len(OUTCOMES)), np.nan, dtype=self._odds.dtype)
+        old_capacity, old_books, _ = self._odds.shape
+        grown[:old_capacity, :old_books] = self._odds
+        self._odds = grown
+
+    def book_id(self, bookmaker):
+        """Column of a bookmaker, adding it if the book has not seen it yet."""
+        b = self._book_ids.get(bookmaker)
+        if b is None:
+            b = self._book_ids[bookmaker] = len(self.bookmakers)
+            self.bookmakers.append(bookmaker)
+            self._grow(self.n_matches, len(self.bookmakers))
+        return b
+
+    def _reserve(self, max_match_id):
+        if max_match_id >= self.n_matches:
+            self._grow(max_match_id + 1, len(self.bookmakers))
+            self.n_matches = max_match_id + 1
+
+    def update(self, match_id, bookmaker, outcome, price):
+        """Set one price and return the one it replaced (NaN if none)."""
+        self._reserve(match_id)
+        b = self.book_id(bookmaker)
+        o = outcome if isinstance(outcome, int) else OUTCOMES.index(outcome)
+        previous = self._odds[match_id, b, o]
+        # Decimal odds at or below 1 can never pay out
+        self._odds[match_id, b, o] = price if price > 1 else np.nan
+        return float(previous)
+
+    def load(self, bookmaker, match_ids, odds):
+        """
+        Write an (n, outcomes) block of decimal odds for one bookmaker and
+        return the IDs of the matches whose prices changed.
+        """
+        match_ids = np.asarray(match_ids, dtype=np.int64)
+        if not len(match_ids):
+            return match_ids
+        self._reserve(int(match_ids.max()))
+        b = self.book_id(bookmaker)
+        odds = np.asarray(odds, dtype=float)
+        new = np.where(odds > 1, odds, np.nan).astype(self._odds.dtype)
+        previous = self._odds[match_ids, b]
+        self._odds[match_ids, b] = new
+        same = (previous == new) | (np.isnan(previous) & np.isnan(new))
+        return match_ids[~same.all(axis=1)]
+
+    def best_prices(self, match_ids=None):
+        """Best price and bookmaker per outcome, for all or some matches."""
+        odds = self.odds if match_ids is None else self.odds[match_ids]
+        return best_prices(odds)
+
+    @classmethod
+    def from_frame(cls, df_combined, bookmakers=None, match_ids=None, dtype=np.float32):
+        """
+        Build a book from the wide combined layout. Rows follow the frame's
+        'Match ID' column when it has one, else the frame's row order.
+        """
+        bookmakers = bookmakers or bookmakers_in(df_combined)
+        if match_ids is None:
+            match_ids = df_combined['Match ID'] if 'Match ID' in df_combined.columns \
+                else np.arange(len(df_combined))
+        book = cls(bookmakers, capacity=max(1, len(df_combined)), dtype=dtype)
+        for bookmaker in bookmakers:
+            columns = [odds_column(outcome, bookmaker) for outcome in OUTCOMES]
+            values = df_combined[columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+            book.load(bookmaker, match_ids, values)
+        return book
@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+
+# Formats a bookmaker's page can print prices in
+ODDS_FORMATS = ('american', 'decimal', 'fractional')
+
+# Spellings of even money (decimal 2.0)
+_EVENS = {'EVEN', 'EVENS', 'EVS', 'EV'}
+
+
+def american_to_decimal(odds):
+    """+150 -> 2.5, -200 -> 1.5. Zero and non-numbers become NaN."""
+    odds = np.asarray(odds, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        decimal = np.where(odds > 0, odds / 100 + 1, 100 / np.abs(odds) + 1)
+    return np.where(odds == 0, np.nan, decimal)
+
+
+def decimal_to_american(odds):
+    """2.5 -> +150, 1.5 -> -200."""
+    odds = np.asarray(odds, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(odds >= 2, (odds - 1) * 100, -100 / (odds - 1))
+
+
+def fractional_to_decimal(numerator, denominator):
+    """5/2 -> 3.5."""
+    numerator = np.asarray(numerator, dtype=float)
+    denominator = np.asarray(denominator, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return numerator / denominator + 1
+
+
+def decimal_to_probability(odds):
+    """Implied probability (0-1) of decimal odds, margin included."""
+    odds = np.asarray(odds, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(odds > 1, 1 / odds, np.nan)
+
+
+def probability_to_decimal(probability):
+    """Fair decimal odds of a probability (0-1)."""
+    probability = np.asarray(probability, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(probability > 0, 1 / probability, np.nan)
+
+
+def to_decimal(values, odds_format):
+    """Convert numeric American or decimal odds to decimal."""
+    if odds_format == 'american':
+        return american_to_decimal(values)
+    if odds_format == 'decimal':
+        return np.asarray(values, dtype=float)
+    raise ValueError(f"Cannot convert numeric odds from format: {odds_format}")
+
+
+def parse_odds(texts, odds_format=None):
+    """
+    Parse price texts as printed on a page ("+150", "−110", "2.45", "5/2",
+    "EVS") to decimal odds in one pass. Unparseable texts become NaN.
+
+    With `odds_format` unset each text's format is detected: a slash means
+    fractional, a leading sign or a whole number of at least 100 means
+    American, and anything else is decimal.
+    """
+    texts = pd.Series(texts, dtype=object)
+    if texts.empty:
+        return np.empty(0)
+    cleaned = (texts.astype(str).str.strip()
+               .str.replace('−', '-', regex=False)  # Unicode minus
+               .str.replace('–', '-', regex=False)  # En dash
+               .str.replace('½', '.5', regex=False)
+               .str.replace(r'[,\s]', '', regex=True))
+
+    fraction = cleaned.str.extract(r'^(\d+(?:\.\d+)?)/(\d+(?:\.\d+)?)$').astype(float)
+    number = pd.to_numeric(cleaned.str.lstrip('+'), errors='coerce').to_numpy(dtype=float)
+    evens = cleaned.str.upper().isin(_EVENS).to_numpy()
+
+    if odds_format is None:
+        is_fractional = fraction[0].notna().to_numpy()
+        is_american = (cleaned.str.match(r'^[+-]\d') | (
+            cleaned.str.fullmatch(r'\d+') & (pd.Series(number, index=cleaned.index) >= 100)
+        )).to_numpy()
+    elif odds_format in ODDS_FORMATS:
+        is_fractional = np.full(len(cleaned), odds_format == 'fractional')
+        is_american = np.full(len(cleaned), odds_format == 'american')
+    else:
+        raise ValueError(f"Unknown odds format: {odds_format}")
+
+    decimal = np.where(
+        is_fractional, fractional_to_decimal(fraction[0].to_numpy(), fraction[1].to_numpy()),
+        np.where(is_american, american_to_decimal(number), number))
+    decimal = np.where(evens, 2.0, decimal)
+    # Decimal odds at or below 1 can never pay out
+    return np.where(decimal > 1, decimal, np.nan)
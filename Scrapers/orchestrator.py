@@ -0,0 +1,100 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+# Default per-source timeout in seconds
+DEFAULT_TIMEOUT = 60
+
+
+def _timed(scraper):
+    """Run a scraper and return its result with its own wall time."""
+    start = time.perf_counter()
+    df = scraper()
+    return df, time.perf_counter() - start
+
+
+def _deliver(future, name, on_result):
+    """Hand a finished source's rows to the streaming callback."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    df, _ = future.result()
+    if df is not None and not df.empty:
+        try:
+            on_result(name, df)
+        except Exception as e:
+            print(f"{name}: result handler failed ({e})")
+
+
+def run_scrapers(scrapers, timeout=DEFAULT_TIMEOUT, max_workers=None, on_result=None):
+    """
+    Run every scraper concurrently and collect whatever finishes in time.
+
+    `scrapers` maps a source name to a zero-argument callable returning a
+    DataFrame. Returns `(results, statuses)` where `results` maps each source
+    that produced rows to its DataFrame and `statuses` maps every source to a
+    dict with its 'status' ('ok', 'empty', 'error' or 'timeout'), 'elapsed'
+    seconds, 'error' message (if any) and per-stage 'timings' (if the
+    scraper recorded them in `df.attrs`).
+
+    `on_result(name, df)`, if given, is called from the worker thread as
+    soon as each source returns rows, before the others have finished.
+    """
+    results = {}
+    statuses = {}
+    started = {}
+
+    executor = ThreadPoolExecutor(max_workers=max_workers or len(scrapers))
+    futures = {}
+    for name, scraper in scrapers.items():
+        started[name] = time.perf_counter()
+        future = executor.submit(_timed, scraper)
+        if on_result is not None:
+            future.add_done_callback(lambda future, name=name: _deliver(future, name, on_result))
+        futures[future] = name
+
+    # Every source shares the same deadline, so the cycle never takes longer
+    # than the slowest source or the timeout, whichever comes first
+    done, not_done = wait(futures, timeout=timeout)
+
+    for future in done:
+        name = futures[future]
+        try:
+            df, elapsed = future.result()
+        except Exception as e:
+            elapsed = time.perf_counter() - started[name]
+            statuses[name] = {'status': 'error', 'elapsed': elapsed, 'error': str(e), 'timings': {}}
+            continue
+
+        timings = df.attrs.get('timings', {}) if df is not None else {}
+        if df is None or df.empty:
+            statuses[name] = {'status': 'empty', 'elapsed': elapsed, 'error': None, 'timings': timings}
+        else:
+            results[name] = df
+            statuses[name] = {'status': 'ok', 'elapsed': elapsed, 'error': None, 'timings': timings}
+
+    for future in not_done:
+        name = futures[future]
+        future.cancel()
+        statuses[name] = {
+            'status': 'timeout',
+            'elapsed': time.perf_counter() - started[name],
+            'error': f"No result after {timeout}s",
+            'timings': {}
+        }
+
+    # Don't block on stragglers; their threads finish in the background
+    executor.shutdown(wait=False, cancel_futures=True)
+
+    return results, statuses
+
+
+def print_statuses(statuses):
+    """Print a one-line summary per source."""
+    for name, status in statuses.items():
+        line = f"{name}: {status['status']} in {status['elapsed']:.2f}s"
+        if status['error']:
+            line += f" ({status['error']})"
+        if status['timings']:
+            line += " [" + ", ".join(
+                f"{stage} {seconds:.2f}s" for stage, seconds in status['timings'].items()) + "]"
+        print(line)
+
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+
+import aiohttp
+
+# Statuses worth retrying: rate limiting and transient server errors
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class PageFetcher:
+    """
+    Fetch many pages concurrently over pooled keep-alive connections.
+
+    The fetcher owns one event loop and one aiohttp session for its whole
+    life, so connections stay warm between scrape cycles. Each page is
+    requested conditionally (ETag / Last-Modified); a 304 reuses the body
+    from the previous cycle. Failed requests are retried with exponential
+    backoff.
+    """
+
+    def __init__(self, headers=None, timeout=10, retries=3, backoff=0.5, limit_per_host=8):
+        self.headers = headers or {}
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.limit_per_host = limit_per_host
+        self._loop = asyncio.new_event_loop()
+        self._session = None
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    def _get_session(self):
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=self.limit_per_host, keepalive_timeout=120)
+            )
+        return self._session
+
+    async def _fetch(self, session, url):
+        cached = self._cache.get(url)
+        headers = {}
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        for attempt in range(self.retries + 1):
+            try:
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 304 and cached:
+                        return cached['body']
+                    if response.status == 200:
+                        body = await response.read()
+                        self._cache[url] = {
+                            'etag': response.headers.get('ETag'),
+                            'last_modified': response.headers.get('Last-Modified'),
+                            'body': body
+                        }
+                        return body
+                    if response.status not in RETRY_STATUSES:
+                        print(f"Failed to retrieve {url}. Status code: {response.status}")
+                        return None
+                    error = f"status code {response.status}"
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = str(e) or type(e).__name__
+
+            if attempt < self.retries:
+                await asyncio.sleep(self.backoff * 2 ** attempt)
+
+        print(f"Failed to retrieve {url} after {self.retries + 1} attempts: {error}")
+        return None
+
+    async def _fetch_all(self, urls, timeout):
+        if not urls:
+            return {}
+        session = self._get_session()
+        tasks = {url: asyncio.ensure_future(self._fetch(session, url)) for url in urls}
+        done, pending = await asyncio.wait(tasks.values(), timeout=timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            print(f"{len(pending)} of {len(urls)} pages not fetched within {timeout}s")
+            await asyncio.gather(*pending, return_exceptions=True)
+        return {url: task.result() if task in done else None for url, task in tasks.items()}
+
+    def fetch_all(self, urls, timeout=None):
+        """
+        Fetch every URL at once. Returns a dict mapping each URL to its body
+        (bytes), or None for pages that could not be fetched. `timeout`
+        bounds the whole batch, including retries; pages that finished in
+        time are still returned.
+        """
+        with self._lock:
+            return self._loop.run_until_complete(self._fetch_all(list(urls), timeout))
+
+    def close(self):
+        with self._lock:
+            if self._session is not None and not self._session.closed:
+                self._loop.run_until_complete(self._session.close())
+            self._loop.close()
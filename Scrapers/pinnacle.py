@@ -7,6 +7,10 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 import time
+import numpy as np
+from devig import devig
+from odds_format import parse_odds
+from team_names import normalize_team_name
 
 # Setup Selenium
 options = Options()
@@ -22,12 +26,7 @@ time.sleep(5)  # Basic wait for content to load; adjust as needed
 
 # Lists to store data
 games = []
-home_win_odds = []
-draw_odds = []
-away_win_odds = []
-home_win_prob = []
-draw_prob = []
-away_win_prob = []
+odds_texts = []
 
 # Locate each game row
 game_rows = WebDriverWait(driver, 100).until(
@@ -40,29 +39,6 @@ for row in game_rows:
         # Extract team names
         teams = row.find_elements(By.CSS_SELECTOR, 'div.gameInfoLabel-EDDYv5xEfd span')
 
-        TEAM_NAME_MAPPING = {
-            "Manchester United": "Manchester United",
-            "Chelsea": "Chelsea",
-            "Fulham": "Fulham",
-            "Brentford": "Brentford",
-            "West Ham United": "West Ham United",
-            "Everton": "Everton",
-            "Wolves": "Wolverhampton Wanderers",
-            "Southampton": "Southampton",
-            "Crystal Palace": "Crystal Palace",
-            "Bournemouth": "AFC Bournemouth",
-            "Brighton and Hove Albion": "Brighton & Hove Albion",
-            "Manchester City": "Manchester City",
-            "Liverpool": "Liverpool",
-            "Aston Villa": "Aston Villa",
-            "Tottenham Hotspur": "Tottenham Hotspur",
-            "Ipswich Town": "Ipswich Town",
-            "Leicester City": "Leicester City",
-            "Nottingham Forest": "Nottingham Forest",
-            "Newcastle United": "Newcastle United",
-            "Arsenal": "Arsenal"
-        }
-
         if len(teams) >= 2:
             home_team = teams[0].text.replace("(Match)", "")
             away_team = teams[1].text
@@ -71,14 +47,8 @@ for row in game_rows:
             else:
                 away_team = teams[1].text.replace("(Match)", "")
 
-            def normalize_team_name(team_name):
-                """Normalize team names using the TEAM_NAME_MAPPING dictionary."""
-                # Strip any extra whitespace and use the dictionary to normalize
-                normalized_name = team_name.strip()
-                return TEAM_NAME_MAPPING.get(normalized_name, normalized_name)
-
-            team1 = normalize_team_name(home_team.strip())
-            team2 = normalize_team_name(away_team.strip())
+            team1 = normalize_team_name(home_team, 'pinnacle')
+            team2 = normalize_team_name(away_team, 'pinnacle')
 
             game_name = f"{team1} vs {team2}"
             games.append(game_name)
@@ -89,40 +59,11 @@ for row in game_rows:
         odds = row.find_elements(By.CSS_SELECTOR, 'span.price-r5BU0ynJha')
         print(f"Odds found: {[odd.text for odd in odds]}")  # Debugging statement
         if len(odds) >= 3:
-            # Convert odds to float and calculate implied probabilities
-            home_odds = float(odds[0].text)
-            draw_odds_value = float(odds[1].text)
-            away_odds = float(odds[2].text)
-            
-            home_win_odds.append(home_odds)
-            draw_odds.append(draw_odds_value)
-            away_win_odds.append(away_odds)
-            
-            # Calculate initial implied probabilities
-            home_prob = (1 / home_odds) * 100
-            draw_prob_value = (1 / draw_odds_value) * 100
-            away_prob = (1 / away_odds) * 100
-
-            # Calculate total implied probability (overround)
-            total_implied_prob = home_prob + draw_prob_value + away_prob
-
-            # Adjust each probability to remove overround
-            fair_home_prob = round((home_prob / total_implied_prob) * 100, 2)
-            fair_draw_prob = round((draw_prob_value / total_implied_prob) * 100, 2)
-            fair_away_prob = round((away_prob / total_implied_prob) * 100, 2)
-
-            # Append adjusted probabilities
-            home_win_prob.append(fair_home_prob)
-            draw_prob.append(fair_draw_prob)
-            away_win_prob.append(fair_away_prob)
+            # Keep the price texts; they are converted below in one pass
+            odds_texts.append([odd.text for odd in odds[:3]])
         else:
             # If odds are missing, add None values
-            home_win_odds.append(None)
-            draw_odds.append(None)
-            away_win_odds.append(None)
-            home_win_prob.append(None)
-            draw_prob.append(None)
-            away_win_prob.append(None)
+            odds_texts.append([None] * 3)
     except Exception as e:
         print(f"Error extracting data for a row: {e}")
         continue
@@ -130,15 +71,20 @@ for row in game_rows:
 # Close the browser
 driver.quit()
 
+# Pinnacle prints decimal odds; parse them and remove the margin like every
+# other scraper
+odds = parse_odds(np.ravel(odds_texts), 'decimal').reshape(-1, 3)
+probabilities = np.round(devig(odds) * 100, 2)
+
 # Create a DataFrame
 df = pd.DataFrame({
     'Game': games,
-    'Home Win Odds (1)': home_win_odds,
-    'Draw Odds (X)': draw_odds,
-    'Away Win Odds (2)': away_win_odds,
-    'Home Win Probability (%)': home_win_prob,
-    'Draw Probability (%)': draw_prob,
-    'Away Win Probability (%)': away_win_prob
+    'Home Win Odds (1)': odds[:, 0],
+    'Draw Odds (X)': odds[:, 1],
+    'Away Win Odds (2)': odds[:, 2],
+    'Home Win Probability (%)': probabilities[:, 0],
+    'Draw Probability (%)': probabilities[:, 1],
+    'Away Win Probability (%)': probabilities[:, 2]
 })
 
 df.sort_values(by='Game', inplace=True)
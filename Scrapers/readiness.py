@@ -0,0 +1,56 @@
+import time
+from contextlib import contextmanager
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+# True once at least `min_count` elements match the selector and every one
+# of them has rendered a non-empty price
+_PRICES_READY_JS = """
+const prices = document.querySelectorAll(arguments[0]);
+if (prices.length < arguments[1]) return false;
+for (const price of prices) {
+    if (!price.textContent.trim()) return false;
+}
+return true;
+"""
+
+
+class StageTimer:
+    """Record how long each stage of a scrape takes against a latency budget."""
+
+    def __init__(self, budget=None):
+        self.budget = budget
+        self.timings = {}
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0) + time.perf_counter() - start
+
+    def elapsed(self):
+        return time.perf_counter() - self._start
+
+    def remaining(self):
+        """Seconds left in the budget (None if there is no budget)."""
+        if self.budget is None:
+            return None
+        return max(0.0, self.budget - self.elapsed())
+
+
+def wait_for_prices(driver, selector, timeout, min_count=3, poll_frequency=0.1):
+    """
+    Block until the odds selector is populated, or `timeout` seconds pass.
+    Returns True if the prices rendered in time.
+    """
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=poll_frequency).until(
+            lambda d: d.execute_script(_PRICES_READY_JS, selector, min_count)
+        )
+        return True
+    except TimeoutException:
+        return False
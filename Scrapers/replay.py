@@ -0,0 +1,186 @@
+import argparse
+import functools
+import os
+import random
+import re
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+import scrapers
+from readiness import wait_for_prices
+
+# Where recorded pages are kept, one sub-directory per bookmaker
+DEFAULT_FIXTURES_DIR = 'fixtures'
+
+# Stage columns of the timing report, in pipeline order
+STAGES = ['fetch', 'render_wait', 'extract', 'normalize', 'dataframe']
+
+_SCRIPT_TAGS = re.compile(r'<script\b.*?</script>', re.IGNORECASE | re.DOTALL)
+
+
+def _write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    mode = 'wb' if isinstance(content, bytes) else 'w'
+    with open(path, mode, **({} if mode == 'wb' else {'encoding': 'utf-8'})) as f:
+        f.write(content)
+
+
+def _page_name(url):
+    return url.rstrip('/').rsplit('/', 1)[-1] + '.html'
+
+
+def record(fixtures_dir=DEFAULT_FIXTURES_DIR):
+    """Save the live pages every scraper reads so they can be replayed offline."""
+    pages = scrapers.DRAFTKINGS_FETCHER.fetch_all(scrapers.DRAFTKINGS_LEAGUE_URLS)
+    for url, content in pages.items():
+        if content:
+            _write(os.path.join(fixtures_dir, 'draftkings', _page_name(url)), content)
+
+    for bookmaker, url, price_selector in (
+        ('pinnacle', scrapers.PINNACLE_URL, scrapers.PINNACLE_PRICE_SELECTOR),
+        ('betmgm', scrapers.BETMGM_URL, scrapers.BETMGM_PRICE_SELECTOR)
+    ):
+        with scrapers.DRIVER_POOL.driver() as driver:
+            driver.get(url)
+            wait_for_prices(driver, price_selector, scrapers.BOOKMAKERS[bookmaker]['latency_budget'])
+            # Keep the rendered DOM but not the scripts, which would re-render
+            # (or hit the network) when the snapshot is replayed
+            source = _SCRIPT_TAGS.sub('', driver.page_source)
+        _write(os.path.join(fixtures_dir, bookmaker, 'index.html'), source)
+    print(f"Fixtures saved to '{fixtures_dir}'")
+
+
+def generate(fixtures_dir=DEFAULT_FIXTURES_DIR, n_matches=200, seed=0):
+    """
+    Write synthetic pages using each book's real selectors, for benchmarking
+    on a machine that has never recorded live pages.
+    """
+    rng = random.Random(seed)
+    matches = [(f"Home Club {i}", f"Away Club {i}") for i in range(n_matches)]
+
+    def decimal():
+        return f"{rng.uniform(1.2, 9.0):.2f}"
+
+    def american():
+        value = rng.randint(100, 900)
+        return f"+{value}" if rng.random() < 0.5 else f"−{value}"
+
+    def kickoff():
+        return f"{rng.randint(12, 21)}:{rng.choice(['00', '15', '30', '45'])}"
+
+    draftkings = ''.join(
+        '<div class="sportsbook-event-accordion__wrapper expanded">'
+        f'<a class="sportsbook-event-accordion__title" href="#">{home} vs {away}</a>'
+        f'<span class="sportsbook-event-accordion__date"><span>TOMORROW {kickoff()}</span></span>'
+        + ''.join(f'<span class="sportsbook-odds american">{american()}</span>' for _ in range(3))
+        + '</div>'
+        for home, away in matches
+    )
+    pinnacle = ''.join(
+        '<div class="row-u9F3b9WCM3 row-k9ktBvvTsJ">'
+        f'<div class="gameInfoLabel-EDDYv5xEfd"><span>{home}</span></div>'
+        f'<div class="gameInfoLabel-EDDYv5xEfd"><span>{away}</span></div>'
+        f'<div class="matchupDate-tnomIYorwd">Tomorrow {kickoff()}</div>'
+        + ''.join(f'<span class="price-r5BU0ynJha">{decimal()}</span>' for _ in range(3))
+        + '</div>'
+        for home, away in matches
+    )
+    betmgm = ''.join(
+        '<ms-event class="grid-event"><div class="participant-info">'
+        f'<div class="participant">{home}</div><div class="participant">{away}</div></div>'
+        f'<ms-prematch-timer>Tomorrow • {kickoff()}</ms-prematch-timer>'
+        + ''.join(f'<span class="custom-odds-value-style">{decimal()}</span>' for _ in range(3))
+        + '</ms-event>'
+        for home, away in matches
+    )
+
+    page = '<!DOCTYPE html><html><head><meta charset="utf-8"></head><body>{}</body></html>'
+    _write(os.path.join(fixtures_dir, 'draftkings', 'synthetic.html'), page.format(draftkings))
+    _write(os.path.join(fixtures_dir, 'pinnacle', 'index.html'), page.format(pinnacle))
+    _write(os.path.join(fixtures_dir, 'betmgm', 'index.html'), page.format(betmgm))
+    print(f"Synthetic fixtures with {n_matches} matches saved to '{fixtures_dir}'")
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(fixtures_dir):
+    """Serve the fixtures on a local port; returns the server and its base URL."""
+    handler = functools.partial(_QuietHandler, directory=os.path.abspath(fixtures_dir))
+    server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def replay(fixtures_dir=DEFAULT_FIXTURES_DIR, repeat=3, sources=None):
+    """
+    Run every scraper (or only `sources`) against the local stand-in server
+    and report how long each stage took, per source and run. A source that
+    fails is recorded in the report's 'Error' column and the rest still run.
+    """
+    server, base_url = serve(fixtures_dir)
+    draftkings_dir = os.path.join(fixtures_dir, 'draftkings')
+    draftkings_urls = [
+        f"{base_url}/draftkings/{name}"
+        for name in sorted(os.listdir(draftkings_dir)) if name.endswith('.html')
+    ] if os.path.isdir(draftkings_dir) else []
+
+    runs = {
+        'draftkings': lambda: scrapers.scrape_draftkings(draftkings_urls),
+        'pinnacle': lambda: scrapers.scrape_pinnacle(f"{base_url}/pinnacle/index.html"),
+        'betmgm': lambda: scrapers.scrape_betmgm(f"{base_url}/betmgm/index.html")
+    }
+
+    report = []
+    try:
+        for bookmaker in sources or runs:
+            for attempt in range(repeat):
+                try:
+                    df, error = runs[bookmaker](), None
+                except Exception as e:
+                    # e.g. no Chrome for the rendered books; keep timing the others
+                    df, error = pd.DataFrame(), f"{type(e).__name__}: {e}"
+                    print(f"{bookmaker}: replay run {attempt + 1} failed ({error})")
+                report.append({
+                    'Source': bookmaker,
+                    'Run': attempt + 1,
+                    'Rows': len(df),
+                    **{stage: df.attrs.get('timings', {}).get(stage) for stage in STAGES},
+                    'Error': error
+                })
+                if error is not None:
+                    break
+    finally:
+        server.shutdown()
+
+    df_report = pd.DataFrame(report)
+    df_report[STAGES] = (df_report[STAGES].astype(float) * 1000).round(1)
+    print("Stage timings (ms):")
+    print(df_report.to_string(index=False))
+    return df_report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record and replay scraper pages offline.")
+    parser.add_argument('command', choices=['record', 'synthetic', 'replay'])
+    parser.add_argument('--dir', default=DEFAULT_FIXTURES_DIR, help="fixtures directory")
+    parser.add_argument('--matches', type=int, default=200, help="matches per synthetic page")
+    parser.add_argument('--repeat', type=int, default=3, help="replay runs per source")
+    parser.add_argument('--sources', nargs='+', choices=['draftkings', 'pinnacle', 'betmgm'],
+                        help="only replay these sources")
+    args = parser.parse_args()
+
+    if args.command == 'record':
+        record(args.dir)
+    elif args.command == 'synthetic':
+        generate(args.dir, args.matches)
+    else:
+        replay(args.dir, args.repeat, args.sources)
+
+
+if __name__ == "__main__":
+    main()
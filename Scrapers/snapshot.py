@@ -0,0 +1,94 @@
+import os
+import time
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:  # Fall back to the CSV hand-off
+    pa = None
+
+# Bump when the combined layout changes in a way readers must know about
+SCHEMA_VERSION = 1
+
+DEFAULT_SNAPSHOT_PATH = 'combined_betting_data.arrow'
+
+
+# First line of a CSV snapshot, carrying its schema version
+_CSV_VERSION_PREFIX = '# schema_version='
+
+
+def _csv_path(path):
+    return os.path.splitext(path)[0] + '.csv'
+
+
+def _check_version(version, path):
+    if version != SCHEMA_VERSION:
+        raise ValueError(
+            f"'{path}' has snapshot schema version {version}; this code reads version {SCHEMA_VERSION}")
+
+
+def _arrow_table(df):
+    # Keep NaN as a float value instead of a null, so numeric columns have
+    # no validity bitmap and read back as zero-copy views of the file
+    arrays = {
+        column: pa.array(df[column].to_numpy(), from_pandas=False)
+        if pd.api.types.is_float_dtype(df[column]) else pa.Array.from_pandas(df[column])
+        for column in df.columns
+    }
+    table = pa.table(arrays)
+    return table.replace_schema_metadata({
+        'schema_version': str(SCHEMA_VERSION),
+        'written_at': str(time.time())
+    })
+
+
+def write_snapshot(df_combined, path=DEFAULT_SNAPSHOT_PATH):
+    """
+    Write the combined snapshot once per cycle as an uncompressed Arrow IPC
+    file tagged with the schema version. The file is replaced atomically,
+    so readers never see half a snapshot. Without pyarrow (or for a .csv
+    `path`) a CSV is written next to `path` instead, its version on a
+    leading comment line. Returns the path written.
+    """
+    if pa is None or path.endswith('.csv'):
+        path = _csv_path(path)
+        with open(path + '.tmp', 'w', encoding='utf-8', newline='') as f:
+            f.write(f"{_CSV_VERSION_PREFIX}{SCHEMA_VERSION}\n")
+            df_combined.to_csv(f, index=False)
+    else:
+        table = _arrow_table(df_combined.reset_index(drop=True))
+        with pa.OSFile(path + '.tmp', 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+    os.replace(path + '.tmp', path)
+    return path
+
+
+def read_snapshot(path=DEFAULT_SNAPSHOT_PATH):
+    """
+    Read the combined snapshot, memory-mapping the Arrow file so numeric
+    columns are views of the page cache rather than parsed copies. Falls
+    back to the CSV next to `path` when there is no Arrow file or no
+    pyarrow. A snapshot without a version tag (such as a CSV from before
+    versioning) is schema version 0. Raises ValueError for any version
+    other than SCHEMA_VERSION, and FileNotFoundError when there is no
+    snapshot.
+    """
+    if pa is not None and not path.endswith('.csv') and os.path.exists(path):
+        table = pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+        metadata = table.schema.metadata or {}
+        _check_version(int(metadata.get(b'schema_version', b'0')), path)
+        return table.to_pandas(split_blocks=True)
+
+    csv_path = _csv_path(path)
+    if os.path.exists(csv_path):
+        with open(csv_path, encoding='utf-8', newline='') as f:
+            first_line = f.readline().strip()
+            version = int(first_line[len(_CSV_VERSION_PREFIX):]) \
+                if first_line.startswith(_CSV_VERSION_PREFIX) else 0
+            _check_version(version, csv_path)
+            return pd.read_csv(f)
+    raise FileNotFoundError(f"No snapshot at '{path}' or '{csv_path}'")
+
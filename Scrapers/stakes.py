@@ -0,0 +1,142 @@
+import numpy as np
+import pandas as pd
+
+try:
+    from scipy.optimize import linprog
+    from scipy.sparse import csr_matrix, vstack
+except ImportError:  # Fall back to proportional scaling without an LP solver
+    linprog = None
+
+# Leg prefixes of the arbitrage DataFrame, in outcome order
+LEGS = ['Home', 'Draw', 'Away']
+
+
+def _scale_to_limits(stakes, legs, groups, limits, iterations=50):
+    """
+    Shrink (opportunity x leg) stakes until every group's total is within its
+    limit. `legs` maps each leg to a group (e.g. a bookmaker) and `groups`
+    maps each opportunity to a group (e.g. its match); `limits` is
+    {'legs': per-group caps, 'groups': per-group caps}, NaN meaning no cap.
+    Whole opportunities are scaled, so an arbitrage keeps its equal payout.
+    """
+    stakes = stakes.copy()
+    for _ in range(iterations):
+        factor = np.ones(len(stakes))
+        for labels, caps, per_leg in ((legs, limits['legs'], True), (groups, limits['groups'], False)):
+            totals = np.bincount(labels.ravel(), weights=(stakes if per_leg else stakes.sum(axis=1)).ravel(),
+                                 minlength=len(caps))
+            with np.errstate(divide='ignore', invalid='ignore'):
+                group_factor = np.where(np.isnan(caps) | (totals <= caps), 1.0, caps / totals)
+            if per_leg:
+                # An opportunity shrinks by its most constrained leg
+                factor = np.minimum(factor, group_factor[labels].min(axis=1))
+            else:
+                factor = np.minimum(factor, group_factor[labels])
+        if (factor > 1 - 1e-9).all():
+            break
+        stakes *= factor[:, None]
+    return stakes
+
+
+def _book_caps(names, book_limits):
+    book_limits = book_limits or {}
+    return np.array([book_limits.get(name, np.nan) for name in names], dtype=float)
+
+
+def arbitrage_stakes(df_arbitrage, bankroll=1000, book_limits=None, match_cap=0.25):
+    """
+    Split the bankroll across every arbitrage at once.
+
+    Each arbitrage is staked so every outcome pays the same. Arbitrages on
+    the same match share one cap of `match_cap` x bankroll, since only one
+    of their outcomes can win. Each bookmaker's total stake stays within
+    `book_limits` ({bookmaker: max stake}) and the total stays within the
+    bankroll. With SciPy installed the allocation that maximises the
+    guaranteed profit is solved as one linear program, otherwise every
+    arbitrage gets an equal share, scaled down to fit.
+    """
+    df = df_arbitrage.reset_index(drop=True).copy()
+    if df.empty:
+        return df
+
+    odds = df[[f'{leg} Odds' for leg in LEGS]].to_numpy(dtype=float)
+    book_sum = (1 / odds).sum(axis=1)
+    # Share of an arbitrage's total stake on each leg, for equal payouts
+    split = (1 / odds) / book_sum[:, None]
+    margin = 1 / book_sum - 1
+
+    book_names, book_codes = np.unique(
+        df[[f'{leg} Bookmaker' for leg in LEGS]].to_numpy().astype(str).ravel(), return_inverse=True)
+    book_codes = book_codes.reshape(odds.shape)
+    match_codes, match_names = pd.factorize(df['Match'])
+    book_caps = _book_caps(book_names, book_limits)
+    match_caps = np.full(len(match_names), match_cap * bankroll)
+
+    if linprog is not None:
+        n = len(df)
+        rows = np.arange(n)
+        # Per-book totals, per-match totals and the bankroll, as A @ totals <= b
+        book_rows = csr_matrix(
+            (split.ravel(), (book_codes.ravel(), np.repeat(rows, len(LEGS)))), shape=(len(book_names), n))
+        match_rows = csr_matrix((np.ones(n), (match_codes, rows)), shape=(len(match_names), n))
+        capped = ~np.isnan(book_caps)
+        a_ub = vstack([book_rows[capped], match_rows, csr_matrix(np.ones((1, n)))])
+        b_ub = np.concatenate([book_caps[capped], match_caps, [bankroll]])
+        result = linprog(-margin, A_ub=a_ub, b_ub=b_ub, bounds=(0, None), method='highs')
+        totals = result.x if result.success else np.zeros(n)
+        stakes = totals[:, None] * split
+    else:
+        # Equal budget per match, spread over its arbitrages, then scaled to fit
+        per_match = np.bincount(match_codes, minlength=len(match_names))
+        stakes = (match_caps[match_codes] / per_match[match_codes])[:, None] * split
+        stakes = _scale_to_limits(stakes, book_codes, match_codes, {'legs': book_caps, 'groups': match_caps})
+        stakes *= min(1.0, bankroll / stakes.sum()) if stakes.sum() else 1.0
+
+    for i, leg in enumerate(LEGS):
+        df[f'{leg} Stake'] = np.round(stakes[:, i], 2)
+    df['Total Stake'] = np.round(stakes.sum(axis=1), 2)
+    df['Guaranteed Profit'] = np.round(stakes.sum(axis=1) * margin, 2)
+    return df
+
+
+def kelly_fractions(probability, odds, fraction=0.25):
+    """Fractional Kelly share of bankroll per bet (0 where there is no edge)."""
+    probability = np.asarray(probability, dtype=float)
+    odds = np.asarray(odds, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        full = (probability * odds - 1) / (odds - 1)
+    return np.clip(np.nan_to_num(full), 0, None) * fraction
+
+
+def kelly_stakes(df_ev, bankroll=1000, fraction=0.25, book_limits=None, match_cap=0.05):
+    """
+    Fractional-Kelly stakes for every positive-EV price at once.
+
+    The outcomes of one match are mutually exclusive, so only each match's
+    best-edge bet is staked, capped at `match_cap` x bankroll. Stakes are
+    then scaled to the per-book limits and the bankroll.
+    """
+    df = df_ev[df_ev['Expected Value'] > 0].copy()
+    if df.empty:
+        return df.assign(**{'Kelly Fraction': [], 'Stake': []})
+
+    probability = df['Probability (%)'].to_numpy(dtype=float) / 100
+    df['Kelly Fraction'] = np.round(
+        kelly_fractions(probability, df['Odds (Decimal)'].to_numpy(dtype=float), fraction), 4)
+
+    # One bet per match: the one Kelly sizes largest
+    df = df.loc[df.groupby('Match')['Kelly Fraction'].idxmax()]
+    df = df[df['Kelly Fraction'] > 0].reset_index(drop=True)
+
+    stakes = np.minimum(df['Kelly Fraction'].to_numpy() * bankroll, match_cap * bankroll)[:, None]
+    book_names, book_codes = np.unique(df['Bookmaker'].astype(str), return_inverse=True)
+    match_codes = np.arange(len(df))
+    stakes = _scale_to_limits(stakes, book_codes[:, None], match_codes, {
+        'legs': _book_caps(book_names, book_limits),
+        'groups': np.full(len(df), np.nan)
+    })[:, 0]
+    if stakes.sum() > bankroll:
+        stakes *= bankroll / stakes.sum()
+
+    df['Stake'] = np.round(stakes, 2)
+    return df.sort_values('Stake', ascending=False).reset_index(drop=True)
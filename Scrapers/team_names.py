@@ -0,0 +1,125 @@
+import re
+import unicodedata
+from difflib import get_close_matches
+from functools import lru_cache
+
+# Canonical club name -> aliases any bookmaker may use for it
+CANONICAL_TEAMS = {
+    "AFC Bournemouth": ["Bournemouth"],
+    "Arsenal": [],
+    "Aston Villa": [],
+    "Brentford": [],
+    "Brighton & Hove Albion": ["Brighton", "Brighton and Hove Albion"],
+    "Chelsea": [],
+    "Crystal Palace": [],
+    "Everton": ["Everton FC"],
+    "Fulham": [],
+    "Ipswich Town": ["Ipswich"],
+    "Leicester City": ["Leicester"],
+    "Liverpool": [],
+    "Manchester City": ["Man City"],
+    "Manchester United": ["Man Utd", "Man United"],
+    "Newcastle United": ["Newcastle"],
+    "Nottingham Forest": ["Nott'm Forest", "Nottm Forest"],
+    "Southampton": ["Southampton FC"],
+    "Tottenham Hotspur": ["Tottenham", "Spurs"],
+    "West Ham United": ["West Ham"],
+    "Wolverhampton Wanderers": ["Wolves"]
+}
+
+# Aliases only one bookmaker uses, checked before the shared table
+BOOKMAKER_ALIASES = {
+    'draftkings': {},
+    'pinnacle': {},
+    'betmgm': {}
+}
+
+# Words that carry no identity ("Everton FC" is "Everton")
+_NOISE_WORDS = {'fc', 'afc', 'cf'}
+_PUNCTUATION = re.compile(r"[^\w\s]")
+
+# Words marking a different squad of the club ("Man City W", "Brentford B");
+# a fuzzy match must not drop them and merge the fixture into the first team's
+_SQUAD_WORDS = {
+    'w', 'women', 'womens', 'ladies', 'fem', 'femenino', 'feminin', 'feminine', 'frauen',
+    'b', 'ii', 'iii', 'reserve', 'reserves', 'res', 'youth', 'academy', 'amateur'
+}
+_AGE_GROUP = re.compile(r'^u\d{2}$')
+
+
+def _squad_words(key):
+    return {word for word in key.split() if word in _SQUAD_WORDS or _AGE_GROUP.match(word)}
+
+
+def team_key(name):
+    """Casefold, strip accents and punctuation, and drop club-type suffixes."""
+    name = unicodedata.normalize('NFKD', name)
+    name = ''.join(c for c in name if not unicodedata.combining(c))
+    name = _PUNCTUATION.sub(' ', name.casefold().replace('&', ' and '))
+    return ' '.join(word for word in name.split() if word not in _NOISE_WORDS)
+
+
+class TeamResolver:
+    """
+    Map any bookmaker's spelling of a club to one canonical name.
+
+    Known names and aliases resolve with a dictionary lookup on their
+    normalised key. Unknown names fall back to a fuzzy match against every
+    known key, and that result is cached so each new spelling is only
+    matched once. A fuzzy match that would drop a squad marker (women's,
+    reserve or youth teams) is rejected.
+    """
+
+    def __init__(self, canonical=CANONICAL_TEAMS, bookmaker_aliases=BOOKMAKER_ALIASES,
+                 cutoff=0.85, cache_size=8192):
+        self.cutoff = cutoff
+        self.unresolved = set()
+        self._index = {}
+        self._by_bookmaker = {}
+        for team, aliases in canonical.items():
+            for alias in [team] + list(aliases):
+                self._index[team_key(alias)] = team
+        for bookmaker, aliases in bookmaker_aliases.items():
+            for alias, team in aliases.items():
+                self.add_alias(alias, team, bookmaker)
+        self._resolve = lru_cache(maxsize=cache_size)(self._resolve_uncached)
+
+    def add_alias(self, alias, team, bookmaker=None):
+        """Teach the resolver another spelling (optionally for one bookmaker)."""
+        if bookmaker is None:
+            self._index[team_key(alias)] = team
+        else:
+            self._by_bookmaker.setdefault(bookmaker, {})[team_key(alias)] = team
+        self._index.setdefault(team_key(team), team)
+        if hasattr(self, '_resolve'):
+            self._resolve.cache_clear()
+
+    def _resolve_uncached(self, name, bookmaker):
+        key = team_key(name)
+        team = self._by_bookmaker.get(bookmaker, {}).get(key) or self._index.get(key)
+        if team is not None:
+            return team
+
+        # Fuzzy fallback against every known spelling
+        match = get_close_matches(key, self._index.keys(), n=1, cutoff=self.cutoff)
+        if match and _squad_words(key) <= _squad_words(match[0]):
+            return self._index[match[0]]
+
+        if name not in self.unresolved:
+            self.unresolved.add(name)
+            print(f"Unknown team name: '{name}'" + (f" ({bookmaker})" if bookmaker else ""))
+        return name.strip()
+
+    def resolve(self, name, bookmaker=None):
+        if not isinstance(name, str):
+            return name  # Missing names (None/NaN) pass through
+        return self._resolve(name.strip(), bookmaker)
+
+
+# Shared resolver used by every scraper
+RESOLVER = TeamResolver()
+
+
+def normalize_team_name(team_name, bookmaker=None):
+    """Normalize a team name to its canonical form."""
+    return RESOLVER.resolve(team_name, bookmaker)
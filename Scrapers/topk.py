@@ -0,0 +1,99 @@
+import bisect
+
+import numpy as np
+
+
+def top_k_indices(values, k):
+    """
+    Indices of the k largest values, largest first, without sorting the
+    rest: argpartition is O(n) and only the k winners are sorted. NaN
+    ranks last.
+    """
+    values = np.asarray(values, dtype=float)
+    values = np.where(np.isnan(values), -np.inf, values)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    if k < len(values):
+        candidates = np.argpartition(-values, k - 1)[:k]
+    else:
+        candidates = np.arange(len(values))
+    return candidates[np.argsort(-values[candidates], kind='stable')]
+
+
+class TopK:
+    """
+    The k best-scoring keys of a changing set, kept up to date one update at
+    a time.
+
+    The current top k is held as a small sorted list, so `best()` is O(k).
+    An update that improves a score, or beats the k-th best, is placed with
+    a binary search. Only when a key in the top k worsens or is removed can
+    an outsider move up, and then the list is rebuilt with one argpartition
+    over all scores on the next query.
+    """
+
+    def __init__(self, k=100):
+        self.k = k
+        self._scores = {}
+        self._top = []  # (-score, key), best first
+        self._in_top = set()
+        self._dirty = False
+
+    def __len__(self):
+        return len(self._scores)
+
+    def _insert(self, key, score):
+        bisect.insort(self._top, (-score, key))
+        self._in_top.add(key)
+        if len(self._top) > self.k:
+            _, dropped = self._top.pop()
+            self._in_top.discard(dropped)
+
+    def _discard(self, key, score):
+        self._top.remove((-score, key))
+        self._in_top.discard(key)
+
+    def update(self, key, score):
+        """Set a key's score; NaN or None removes it."""
+        if score is None or score != score:
+            return self.remove(key)
+        score = float(score)
+        old = self._scores.get(key)
+        self._scores[key] = score
+        if self._dirty or old == score:
+            return
+
+        if key in self._in_top:
+            self._discard(key, old)
+            if score > old or len(self._scores) <= self.k or (self._top and score >= -self._top[-1][0]):
+                self._insert(key, score)
+            else:
+                # It may have dropped below an outsider
+                self._dirty = True
+        elif len(self._top) < self.k or score > -self._top[-1][0]:
+            self._insert(key, score)
+
+    def update_many(self, keys, scores):
+        for key, score in zip(keys, scores):
+            self.update(key, score)
+
+    def remove(self, key):
+        old = self._scores.pop(key, None)
+        if old is None or self._dirty or key not in self._in_top:
+            return
+        self._discard(key, old)
+        if len(self._scores) > len(self._top):
+            self._dirty = True
+
+    def _rebuild(self):
+        keys = list(self._scores)
+        scores = np.fromiter(self._scores.values(), dtype=float, count=len(keys))
+        self._top = [(-scores[i], keys[i]) for i in top_k_indices(scores, self.k)]
+        self._in_top = {key for _, key in self._top}
+        self._dirty = False
+
+    def best(self, n=None):
+        """[(key, score)] of the n (default k) best keys, best first."""
+        if self._dirty:
+            self._rebuild()
+        return [(key, -negative) for negative, key in self._top[:n]]
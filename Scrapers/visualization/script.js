@@ -1,35 +1,264 @@
 // script.js
 
-// Load the CSV data
-d3.csv("most_profitable_matches.csv").then(function(data) {
-    // Dynamically infer the columns from the CSV
-    const columns = Object.keys(data[0]); // Get the column names from the first row of the CSV
-
-    // Create the table structure
-    const table = d3.select("body").append("table");
-    const thead = table.append("thead");
-    const tbody = table.append("tbody");
-
-    // Append the header row
-    thead.append("tr")
+// Pixel height of one table row; the table only renders the rows in view
+const ROW_HEIGHT = 40;
+// Extra rows rendered above and below the viewport so scrolling stays smooth
+const OVERSCAN = 10;
+// How long a moved price stays highlighted (ms)
+const FLASH_MS = 1500;
+// Rows per API page when loading the full table
+const PAGE_SIZE = 1000;
+
+// Every row by its (match, bookmaker, outcome) key, and the sorted view
+const rowsByKey = new Map();
+let view = [];
+let columns = [];
+// Key -> {direction, until} for prices that just moved
+const flashes = new Map();
+
+// Filter text and scroll position survive reloads
+const state = JSON.parse(sessionStorage.getItem("dashboard-state") || "{}");
+let filterText = state.filter || "";
+
+const rowKey = d => `${d["Match"]}|${d["Bookmaker"]}|${d["Outcome"]}`;
+// Missing or unparseable EVs sort last; an EV of exactly 0 is a real value
+const evOf = d => {
+    const value = d["Expected Value"];
+    const ev = value === null || value === undefined || value === "" ? NaN : +value;
+    return Number.isFinite(ev) ? ev : -Infinity;
+};
+
+// Build the page skeleton: filter box, status line, scrolling viewport
+const chart = d3.select("#chart");
+const controls = chart.append("div").attr("class", "controls");
+const filterInput = controls.append("input")
+    .attr("type", "search")
+    .attr("placeholder", "Filter by match or bookmaker")
+    .property("value", filterText);
+const status = controls.append("span").attr("class", "status");
+
+const viewport = chart.append("div").attr("class", "viewport");
+const spacer = viewport.append("div").attr("class", "spacer");
+const table = spacer.append("table");
+const thead = table.append("thead");
+const tbody = table.append("tbody");
+
+function saveState() {
+    sessionStorage.setItem("dashboard-state", JSON.stringify({
+        filter: filterText,
+        scrollTop: viewport.node().scrollTop
+    }));
+}
+
+// Re-derive the filtered, EV-sorted view from the keyed rows
+function rebuildView() {
+    const needle = filterText.toLowerCase();
+    view = Array.from(rowsByKey.values())
+        .filter(d => !needle ||
+            String(d["Match"]).toLowerCase().includes(needle) ||
+            String(d["Bookmaker"]).toLowerCase().includes(needle))
+        .sort((a, b) => {
+            const x = evOf(a), y = evOf(b);
+            return x === y ? 0 : (y > x ? 1 : -1);
+        });
+    spacer.style("height", `${(view.length + 1) * ROW_HEIGHT}px`);
+    status.text(`${view.length} of ${rowsByKey.size} prices`);
+}
+
+// Render only the rows inside the viewport, joined on their key so
+// unchanged rows and cells are left alone
+function render() {
+    const node = viewport.node();
+    const first = Math.max(0, Math.floor(node.scrollTop / ROW_HEIGHT) - OVERSCAN);
+    const last = Math.min(view.length, Math.ceil((node.scrollTop + node.clientHeight) / ROW_HEIGHT) + OVERSCAN);
+    const now = Date.now();
+
+    table.style("transform", `translateY(${first * ROW_HEIGHT}px)`);
+    thead.style("transform", `translateY(${Math.max(0, node.scrollTop - first * ROW_HEIGHT)}px)`);
+
+    thead.selectAll("tr")
+        .data([columns])
+        .join("tr")
         .selectAll("th")
-        .data(columns)
-        .enter()
-        .append("th")
+        .data(d => d)
+        .join("th")
         .text(d => d);
 
-    // Append the rows
     const rows = tbody.selectAll("tr")
-        .data(data)
-        .enter()
-        .append("tr")
+        .data(view.slice(first, last), rowKey)
+        .join("tr")
+        .style("height", `${ROW_HEIGHT}px`)
         // Add highlighting logic based on a column
-        .attr("class", d => +d["Expected Value"] > 1 ? "highlight" : "");
+        .classed("highlight", d => +d["Expected Value"] > 1)
+        .classed("flash-up", d => {
+            const flash = flashes.get(rowKey(d));
+            return !!flash && flash.until > now && flash.direction > 0;
+        })
+        .classed("flash-down", d => {
+            const flash = flashes.get(rowKey(d));
+            return !!flash && flash.until > now && flash.direction < 0;
+        });
 
-    // Append the cells
     rows.selectAll("td")
-        .data(d => columns.map(column => d[column]))
-        .enter()
-        .append("td")
-        .text(d => d);
+        .data(d => columns.map(column => d[column] ?? ""))
+        .join("td")
+        .each(function(value) {
+            // Only touch cells whose text changed
+            const text = String(value);
+            if (this.textContent !== text) this.textContent = text;
+        });
+}
+
+function refresh() {
+    rebuildView();
+    render();
+}
+
+// Merge new or changed rows, remembering which prices moved
+function upsert(rows) {
+    const now = Date.now();
+    rows.forEach(d => {
+        const key = rowKey(d);
+        const previous = rowsByKey.get(key);
+        if (previous && +previous["Odds (Decimal)"] !== +d["Odds (Decimal)"]) {
+            flashes.set(key, {
+                direction: +d["Odds (Decimal)"] > +previous["Odds (Decimal)"] ? 1 : -1,
+                until: now + FLASH_MS
+            });
+        }
+        rowsByKey.set(key, d);
+    });
+    if (!columns.length && rows.length) columns = Object.keys(rows[0]);
+}
+
+function remove(keys) {
+    keys.forEach(d => {
+        rowsByKey.delete(rowKey(d));
+        flashes.delete(rowKey(d));
+    });
+}
+
+// Load every EV row from the API, a page at a time. Returns the server
+// version the rows are from; if the table changes mid-load, start over so
+// no page is from a different version than the rest
+async function loadFromApi() {
+    for (;;) {
+        rowsByKey.clear();
+        let version = null;
+        let offset = 0;
+        let total = Infinity;
+        while (offset < total) {
+            const response = await fetch(`/api/ev?offset=${offset}&limit=${PAGE_SIZE}`);
+            if (!response.ok) throw new Error(`API returned ${response.status}`);
+            const page = await response.json();
+            if (version !== null && page.version !== version) break;
+            version = page.version;
+            upsert(page.rows);
+            total = page.total;
+            offset += PAGE_SIZE;
+            if (!page.rows.length) total = offset;
+        }
+        if (offset >= total) return version;
+    }
+}
+
+// Version of the rows on screen; deltas at or below it are already applied
+let loadedVersion = -1;
+// Newest version the stream has shown us
+let seenVersion = -1;
+// Deltas that arrive while pages are loading, applied once they are in
+let pending = null;
+
+function applyDelta(delta) {
+    seenVersion = Math.max(seenVersion, delta.version);
+    if (delta.version <= loadedVersion || delta.table !== "ev") return;
+    remove(delta.removes);
+    upsert(delta.upserts);
+}
+
+// (Re)load every page while the stream keeps running, then replay the
+// deltas that arrived meanwhile
+async function reload() {
+    if (pending) return;
+    pending = [];
+    let missed = false;
+    try {
+        loadedVersion = await loadFromApi();
+        seenVersion = Math.max(seenVersion, loadedVersion);
+        pending.forEach(delta => {
+            // A reset newer than the pages means deltas were dropped
+            if (delta.reset) missed = missed || delta.version > loadedVersion;
+            else applyDelta(delta);
+        });
+    } finally {
+        pending = null;
+    }
+    refresh();
+    if (missed) await reload();
+}
+
+// Open the stream before loading, so no delta published during the load is
+// lost; a reset, or a reconnect that missed versions, reloads everything
+function subscribe() {
+    const events = new EventSource("/events");
+    events.addEventListener("hello", message => {
+        const { version } = JSON.parse(message.data);
+        if (loadedVersion >= 0 && version !== seenVersion) reload();
+    });
+    events.onmessage = message => {
+        const delta = JSON.parse(message.data);
+        if (pending) {
+            pending.push(delta);
+        } else if (delta.reset) {
+            reload();
+        } else {
+            applyDelta(delta);
+            refresh();
+        }
+    };
+    return events;
+}
+
+async function start() {
+    const events = subscribe();
+    try {
+        await reload();
+    } catch (error) {
+        // No server running: fall back to the static CSV
+        events.close();
+        const data = await d3.csv("most_profitable_matches.csv");
+        upsert(data);
+    }
+
+    rebuildView();
+    viewport.node().scrollTop = state.scrollTop || 0;
+    render();
+}
+
+viewport.on("scroll", () => {
+    render();
+    saveState();
+});
+
+filterInput.on("input", function() {
+    filterText = this.value;
+    saveState();
+    refresh();
 });
+
+// Let finished flashes fade and drop their bookkeeping
+setInterval(() => {
+    const now = Date.now();
+    let expired = false;
+    flashes.forEach((flash, key) => {
+        if (flash.until <= now) {
+            flashes.delete(key);
+            expired = true;
+        }
+    });
+    if (expired) render();
+}, 500);
+
+window.addEventListener("resize", render);
+
+start();
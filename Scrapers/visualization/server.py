@@ -0,0 +1,273 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+
+import pandas as pd
+from aiohttp import WSMsgType, web
+
+# The pipeline lives one directory up and arbitrage.py two
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+sys.path.insert(0, os.path.dirname(os.path.dirname(HERE)))
+
+from arbitrage import find_arbitrage_opportunities
+from bookmakers import to_long
+from changes import IncrementalAnalyzer, match_labels
+from daemon import ScrapeDaemon, save_snapshot
+from EV import find_expected_values
+from snapshot import DEFAULT_SNAPSHOT_PATH, read_snapshot
+from topk import top_k_indices
+
+# Columns identifying one row of each table, as the dashboard joins them
+TABLE_KEYS = {
+    'odds': ['Match', 'Bookmaker', 'Outcome'],
+    'ev': ['Match', 'Bookmaker', 'Outcome'],
+    'arbitrage': ['Match']
+}
+
+# Largest page a client may ask for
+MAX_PAGE_SIZE = 1000
+
+
+def odds_table(df_combined):
+    """One row per (match, bookmaker, outcome) price."""
+    df = to_long(df_combined)
+    df.insert(0, 'Match', match_labels(df))
+    return df.drop(columns=['Home Team', 'Away Team'])
+
+
+def _records(df):
+    # to_json turns NaN into null and numpy scalars into plain numbers
+    return json.loads(df.to_json(orient='records'))
+
+
+class DashboardState:
+    """
+    The latest odds, EV and arbitrage tables, kept in memory.
+
+    Every snapshot is diffed against the previous one, only the matches
+    whose prices moved are re-analysed, and the rows that changed are
+    pushed to every subscriber as one delta per table:
+    {'table', 'version', 'upserts': [rows], 'removes': [keys]}.
+    """
+
+    def __init__(self):
+        self.analyzer = IncrementalAnalyzer({
+            'ev': find_expected_values,
+            'arbitrage': find_arbitrage_opportunities
+        })
+        self.tables = {name: pd.DataFrame() for name in TABLE_KEYS}
+        self.version = 0
+        self.loop = None
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    def apply(self, df_combined):
+        """Take a new combined snapshot (from any thread)."""
+        with self._lock:
+            changes = self.analyzer.update(df_combined)
+            changed = set(changes['Match'])
+            fresh = {'odds': odds_table(df_combined), **self.analyzer.results}
+
+            deltas = []
+            self.version += 1
+            for name, keys in TABLE_KEYS.items():
+                previous, current = self.tables[name], fresh[name]
+                self.tables[name] = current
+                if not changed:
+                    continue
+                upserts = current[current['Match'].isin(changed)] if not current.empty else current
+                removes = []
+                if not previous.empty:
+                    old = previous[previous['Match'].isin(changed)][keys]
+                    kept = upserts[keys] if not upserts.empty else pd.DataFrame(columns=keys)
+                    gone = old.merge(kept, on=keys, how='left', indicator=True)
+                    removes = _records(gone[gone['_merge'] == 'left_only'][keys])
+                if len(upserts) or removes:
+                    deltas.append({
+                        'table': name,
+                        'version': self.version,
+                        'upserts': _records(upserts),
+                        'removes': removes
+                    })
+
+        if self.loop is not None:
+            for delta in deltas:
+                self.loop.call_soon_threadsafe(self._publish, delta)
+
+    def _publish(self, delta):
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(delta)
+            except asyncio.QueueFull:
+                # A client this far behind reloads its pages instead
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({'table': None, 'version': self.version, 'reset': True})
+
+    def subscribe(self):
+        queue = asyncio.Queue(maxsize=256)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue):
+        self._subscribers.discard(queue)
+
+    def page(self, name, offset=0, limit=100, sort=None, descending=True, match=None):
+        """One page of a table, optionally filtered by match text and sorted."""
+        with self._lock:
+            df, version = self.tables[name], self.version
+        if match and not df.empty:
+            df = df[df['Match'].str.contains(match, case=False, regex=False)]
+        total = len(df)
+
+        if sort and sort in df.columns:
+            if descending and pd.api.types.is_numeric_dtype(df[sort]):
+                # Only the rows up to the end of this page need ordering
+                df = df.iloc[top_k_indices(df[sort], offset + limit)]
+            else:
+                df = df.sort_values(sort, ascending=not descending)
+        return {
+            'table': name,
+            'version': version,
+            'total': total,
+            'offset': offset,
+            'limit': limit,
+            'rows': _records(df.iloc[offset:offset + limit])
+        }
+
+
+routes = web.RouteTableDef()
+
+
+@routes.get('/')
+async def index(request):
+    return web.FileResponse(os.path.join(HERE, 'index.html'))
+
+
+# The only files the dashboard loads from disk; nothing else in this
+# directory (the server's own source, other CSVs) is served
+STATIC_FILES = ('index.html', 'script.js', 'style.css', 'most_profitable_matches.csv')
+
+
+def _static_file(name):
+    async def handler(request):
+        return web.FileResponse(os.path.join(HERE, name))
+    return handler
+
+
+@routes.get('/api/{table}')
+async def table(request):
+    name = request.match_info['table']
+    if name not in TABLE_KEYS:
+        raise web.HTTPNotFound(text=f"Unknown table: {name}")
+    try:
+        offset = max(0, int(request.query.get('offset', 0)))
+        limit = min(MAX_PAGE_SIZE, max(1, int(request.query.get('limit', 100))))
+    except ValueError:
+        raise web.HTTPBadRequest(text="offset and limit must be integers")
+    return web.json_response(request.app['state'].page(
+        name, offset, limit,
+        sort=request.query.get('sort'),
+        descending=request.query.get('order', 'desc') != 'asc',
+        match=request.query.get('match')
+    ))
+
+
+@routes.get('/events')
+async def events(request):
+    """Server-sent events: one 'data:' line per delta."""
+    state = request.app['state']
+    response = web.StreamResponse(headers={'Content-Type': 'text/event-stream', 'Cache-Control': 'no-cache'})
+    await response.prepare(request)
+    queue = state.subscribe()
+    try:
+        await response.write(f"event: hello\ndata: {json.dumps({'version': state.version})}\n\n".encode())
+        while True:
+            delta = await queue.get()
+            await response.write(f"data: {json.dumps(delta)}\n\n".encode())
+    except ConnectionResetError:
+        pass
+    finally:
+        state.unsubscribe(queue)
+    return response
+
+
+@routes.get('/ws')
+async def websocket(request):
+    """WebSocket: the same deltas as the event stream, one JSON message each."""
+    state = request.app['state']
+    ws = web.WebSocketResponse(heartbeat=30)
+    await ws.prepare(request)
+    queue = state.subscribe()
+
+    async def forward():
+        while True:
+            await ws.send_json(await queue.get())
+
+    sender = asyncio.create_task(forward())
+    try:
+        await ws.send_json({'table': None, 'version': state.version, 'hello': True})
+        async for message in ws:
+            if message.type == WSMsgType.ERROR:
+                break
+    finally:
+        sender.cancel()
+        state.unsubscribe(queue)
+    return ws
+
+
+def create_app(state, daemon=None):
+    app = web.Application()
+    app['state'] = state
+    app.add_routes(routes)
+    # The dashboard's files (and its CSV fallback) straight from disk
+    for name in STATIC_FILES:
+        app.router.add_get(f'/{name}', _static_file(name))
+
+    async def start(app):
+        state.loop = asyncio.get_running_loop()
+        if daemon is not None:
+            threading.Thread(target=daemon.run, daemon=True).start()
+
+    async def stop(app):
+        if daemon is not None:
+            daemon.stop()
+
+    app.on_startup.append(start)
+    app.on_cleanup.append(stop)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve live odds, EV and arbitrage to the dashboard.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--no-scrape', action='store_true',
+                        help="only serve the last saved snapshot, without scraping")
+    args = parser.parse_args()
+
+    state = DashboardState()
+    snapshot_path = os.path.join(HERE, DEFAULT_SNAPSHOT_PATH)
+    try:
+        state.apply(read_snapshot(snapshot_path))
+    except FileNotFoundError:
+        pass
+    except ValueError as e:
+        print(f"Not loading the saved snapshot: {e}")
+
+    daemon = None
+    if not args.no_scrape:
+        def on_snapshot(df_combined):
+            save_snapshot(df_combined, snapshot_path)
+            state.apply(df_combined)
+        daemon = ScrapeDaemon(on_snapshot=on_snapshot)
+
+    web.run_app(create_app(state, daemon), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
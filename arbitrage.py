@@ -1,78 +1,115 @@
+import os
+import sys
+
+import numpy as np
 import pandas as pd
 
+# The bookmaker registry lives with the scrapers
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Scrapers'))
+
+from bookmakers import bookmakers_in
+from odds_book import OddsBook, best_prices
+from snapshot import read_snapshot
+from stakes import arbitrage_stakes
+from team_names import normalize_team_name
+
+
+# Total stake available per refresh
+BANKROLL = 1000
+
+# Upper bound on (matches x books^3) cells evaluated at once in 'all' mode
+MAX_COMBINATION_CELLS = 2_000_000
+
+
+def build_odds_matrix(df_combined, bookmakers):
+    """
+    Build a (matches x bookmakers x outcomes) array of decimal odds.
+    Missing or unusable prices are NaN.
+    """
+    book = OddsBook.from_frame(df_combined, bookmakers, match_ids=np.arange(len(df_combined)), dtype=float)
+    return book.odds
+
+
+def _best_price_opportunities(odds):
+    """Take the best price per outcome and keep matches whose book sum is below 1."""
+    best_odds, best_books = best_prices(odds)
+    book_sum = (1 / best_odds).sum(axis=1)
+    # A match needs a price on every outcome to be covered
+    priced = np.isfinite(best_odds).all(axis=1)
+    rows = np.nonzero(priced & (book_sum < 1))[0]
+    return rows, best_books[rows], best_odds[rows], book_sum[rows]
+
+
+def _all_combination_opportunities(odds):
+    """Evaluate every home x draw x away bookmaker combination for every match."""
+    n_matches, n_books, _ = odds.shape
+    inverse = 1 / odds
+    chunk = max(1, MAX_COMBINATION_CELLS // max(1, n_books ** 3))
+
+    rows, books, prices, sums = [], [], [], []
+    for start in range(0, n_matches, chunk):
+        block = inverse[start:start + chunk]
+        # Broadcast to (matches, home book, draw book, away book)
+        book_sum = (
+            block[:, :, None, None, 0]
+            + block[:, None, :, None, 1]
+            + block[:, None, None, :, 2]
+        )
+        match, home, draw, away = np.nonzero(book_sum < 1)
+        combo_books = np.stack([home, draw, away], axis=1)
+        match += start
+
+        rows.append(match)
+        books.append(combo_books)
+        prices.append(odds[match[:, None], combo_books, np.arange(3)])
+        sums.append(book_sum[match - start, home, draw, away])
+
+    if not rows:
+        return np.empty(0, dtype=int), np.empty((0, 3), dtype=int), np.empty((0, 3)), np.empty(0)
+    return np.concatenate(rows), np.concatenate(books), np.concatenate(prices), np.concatenate(sums)
+
+
+def find_arbitrage_opportunities(df_combined, mode='best'):
+    """
+    Find arbitrage opportunities across every bookmaker column at once.
+
+    mode='best' reports one row per profitable match using the best price for
+    each outcome; mode='all' lists every bookmaker combination that is an
+    arbitrage, including sub-optimal ones.
+    """
+    bookmakers = bookmakers_in(df_combined)
+    if not bookmakers or df_combined.empty:
+        return pd.DataFrame()
+
+    odds = build_odds_matrix(df_combined, bookmakers)
+
+    if mode == 'best':
+        rows, books, prices, book_sum = _best_price_opportunities(odds)
+    elif mode == 'all':
+        rows, books, prices, book_sum = _all_combination_opportunities(odds)
+    else:
+        raise ValueError(f"Unknown arbitrage mode: {mode}")
 
-def normalize_team_name(team_name):
-    """Normalize team names if necessary."""
-    # Assuming team names are already normalized in your combined CSV
-    return team_name.strip()
-
-
-def find_arbitrage_opportunities(df_combined):
-    arbitrage_opportunities = []
-
-    # Iterate over each match
-    for idx, row in df_combined.iterrows():
-        home_team = row['Home Team']
-        away_team = row['Away Team']
-        match = f"{home_team} vs {away_team}"
-
-        # Collect available odds from different bookmakers
-        odds_home = {
-            'draftkings': row.get('Home Win Probability_draftkings'),
-            'pinnacle': row.get('Home Win Probability_pinnacle'),
-            'betmgm': row.get('Home Win Probability_betmgm')
-        }
-        odds_draw = {
-            'draftkings': row.get('Draw Probability_draftkings'),
-            'pinnacle': row.get('Draw Probability_pinnacle'),
-            'betmgm': row.get('Draw Probability_betmgm')
-        }
-        odds_away = {
-            'draftkings': row.get('Away Win Probability_draftkings'),
-            'pinnacle': row.get('Away Win Probability_pinnacle'),
-            'betmgm': row.get('Away Win Probability_betmgm')
-        }
-
-        # Remove NaN values
-        odds_home = {k: v for k, v in odds_home.items() if pd.notna(v)}
-        odds_draw = {k: v for k, v in odds_draw.items() if pd.notna(v)}
-        odds_away = {k: v for k, v in odds_away.items() if pd.notna(v)}
-
-        # Ensure odds are numeric
-        try:
-            odds_home = {k: float(v) for k, v in odds_home.items()}
-            odds_draw = {k: float(v) for k, v in odds_draw.items()}
-            odds_away = {k: float(v) for k, v in odds_away.items()}
-        except ValueError:
-            continue  # Skip this row if conversion fails
-
-        # Generate all combinations of odds from different bookmakers
-        for bookmaker_home, odd_home in odds_home.items():
-            for bookmaker_draw, odd_draw in odds_draw.items():
-                for bookmaker_away, odd_away in odds_away.items():
-                    # Calculate arbitrage percentage
-                    arbitrage_percentage = (
-                        100/odd_home) + (100/odd_draw) + (100/odd_away)
-                    if arbitrage_percentage < 100:
-                        arbitrage_opportunities.append({
-                            'Match': match,
-                            'Home Bookmaker': bookmaker_home,
-                            'Home Odds': odd_home,
-                            'Draw Bookmaker': bookmaker_draw,
-                            'Draw Odds': odd_draw,
-                            'Away Bookmaker': bookmaker_away,
-                            'Away Odds': odd_away,
-                            'Arbitrage Percentage': round(arbitrage_percentage * 100, 2)
-                        })
+    names = np.array(bookmakers, dtype=object)
+    matches = (df_combined['Home Team'].astype(str) + ' vs ' + df_combined['Away Team'].astype(str)).to_numpy()
 
     # Create a DataFrame for arbitrage opportunities
-    df_arbitrage = pd.DataFrame(arbitrage_opportunities)
+    df_arbitrage = pd.DataFrame({
+        'Match': matches[rows],
+        'Home Bookmaker': names[books[:, 0]],
+        'Home Odds': prices[:, 0],
+        'Draw Bookmaker': names[books[:, 1]],
+        'Draw Odds': prices[:, 1],
+        'Away Bookmaker': names[books[:, 2]],
+        'Away Odds': prices[:, 2],
+        'Arbitrage Percentage': np.round(book_sum * 100, 2)
+    })
     return df_arbitrage
 
 
 def main():
-    # Read the combined data from the CSV file
-    df_combined = pd.read_csv('combined_betting_data.csv')
+    # Read the combined snapshot (memory-mapped, CSV if that is all there is)
+    df_combined = read_snapshot()
 
     # Ensure team names are normalized (if not already)
     df_combined['Home Team'] = df_combined['Home Team'].apply(
@@ -80,10 +117,11 @@ def main():
     df_combined['Away Team'] = df_combined['Away Team'].apply(
         normalize_team_name)
 
-    # Find arbitrage opportunities
+    # Find arbitrage opportunities and split the bankroll across them
     df_arbitrage = find_arbitrage_opportunities(df_combined)
 
     if not df_arbitrage.empty:
+        df_arbitrage = arbitrage_stakes(df_arbitrage, bankroll=BANKROLL)
         print("Arbitrage opportunities found:")
         print(df_arbitrage)
         # Optionally, save to CSV